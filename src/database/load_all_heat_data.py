@@ -36,18 +36,56 @@ def get_connection():
 
 
 def load_csv(csv_path, name):
-    """Load CSV file"""
+    """Load CSV (or Parquet) file"""
     print(f"\nLoading {name} from: {csv_path}")
 
     if not os.path.exists(csv_path):
         print(f"[WARNING] File not found: {csv_path}")
         return None
 
-    df = pd.read_csv(csv_path)
+    if csv_path.endswith('.feather'):
+        df = pd.read_feather(csv_path)
+    elif csv_path.endswith('.parquet'):
+        df = pd.read_parquet(csv_path)
+    else:
+        df = pd.read_csv(csv_path)
     print(f"[OK] Loaded {len(df)} records")
     return df
 
 
+def id_str(value):
+    """
+    Format a LiveHeats ID as an integer string ('' when missing)
+
+    CSV columns with blank fillers read as floats (555.0) while the Parquet
+    heat scores keep Int64 (555), so every loader formats IDs through here to
+    store the same ID the same way in each table.
+    """
+    if pd.isna(value):
+        return ''
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def latest_scores_path(processed_dir):
+    """
+    Pick the most recently written merged heat scores file
+
+    merge_heat_scores.py only warns when it cannot overwrite one of its outputs,
+    so the newest file is used rather than the first format that exists. Ties
+    go to the faster format (feather, then parquet, then CSV).
+    """
+    candidates = [
+        os.path.join(processed_dir, f'heat_scores_merged.{ext}')
+        for ext in ('feather', 'parquet', 'csv')
+    ]
+    existing = [path for path in candidates if os.path.exists(path)]
+    if not existing:
+        return candidates[-1]
+    return max(existing, key=lambda path: (os.path.getmtime(path), -candidates.index(path)))
+
+
 def load_heat_progression(cursor, df):
     """Load heat progression data"""
     if df is None or df.empty:
@@ -99,8 +137,8 @@ def load_heat_progression(cursor, df):
             int(row['total_losers_progressing']) if pd.notna(row['total_losers_progressing']) else None,
             int(row['losers_progressing_to_round_order']) if pd.notna(row['losers_progressing_to_round_order']) else None,
             str(row['elimination_name']) if pd.notna(row['elimination_name']) else '',
-            str(row['liveheats_event_id']) if pd.notna(row['liveheats_event_id']) else '',
-            str(row['liveheats_division_id']) if pd.notna(row['liveheats_division_id']) else '',
+            id_str(row['liveheats_event_id']),
+            id_str(row['liveheats_division_id']),
             str(row['division_name']) if pd.notna(row['division_name']) else ''
         )
         records.append(record)
@@ -163,8 +201,8 @@ def load_heat_results(cursor, df):
             float(row['needs']) if pd.notna(row['needs']) else None,
             str(row['round']) if pd.notna(row['round']) else '',
             int(row['round_position']) if pd.notna(row['round_position']) else None,
-            str(row['liveheats_event_id']) if pd.notna(row['liveheats_event_id']) else '',
-            str(row['liveheats_division_id']) if pd.notna(row['liveheats_division_id']) else ''
+            id_str(row['liveheats_event_id']),
+            id_str(row['liveheats_division_id'])
         )
         records.append(record)
 
@@ -232,8 +270,8 @@ def load_heat_scores(cursor, df):
             float(row['total_wave']) if pd.notna(row['total_wave']) else None,
             float(row['total_jump']) if pd.notna(row['total_jump']) else None,
             float(row['total_points']) if pd.notna(row['total_points']) else None,
-            str(row['liveheats_event_id']) if pd.notna(row['liveheats_event_id']) else '',
-            str(row['liveheats_division_id']) if pd.notna(row['liveheats_division_id']) else ''
+            id_str(row['liveheats_event_id']),
+            id_str(row['liveheats_division_id'])
         )
         records.append(record)
 
@@ -287,7 +325,7 @@ def main():
         # Load CSVs
         prog_df = load_csv(os.path.join(processed_dir, 'heat_progression_merged.csv'), 'Heat Progression')
         results_df = load_csv(os.path.join(processed_dir, 'heat_results_merged.csv'), 'Heat Results')
-        scores_df = load_csv(os.path.join(processed_dir, 'heat_scores_merged.csv'), 'Heat Scores')
+        scores_df = load_csv(latest_scores_path(processed_dir), 'Heat Scores')
 
         # Connect to database
         print("\nConnecting to Oracle MySQL Heatwave...")
@@ -0,0 +1,47 @@
+"""
+Shared CSV writer for scraper and merge outputs.
+
+Writes through pyarrow's multithreaded C++ CSV writer. String fields are
+always quoted; pd.read_csv parses the result the same way as pandas' own
+to_csv output.
+"""
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+
+def to_arrow_table(df):
+    """
+    Convert a DataFrame to an Arrow table, casting mixed-type object columns to strings.
+
+    pyarrow rejects object columns that mix value types (e.g. sail numbers read
+    as ints from one source and strings from another), which pandas' to_csv
+    writes without complaint.
+
+    Args:
+        df: DataFrame to convert (index is dropped)
+
+    Returns:
+        pyarrow Table
+    """
+    mixed_cols = [
+        col for col in df.select_dtypes(include='object').columns
+        if pd.api.types.infer_dtype(df[col], skipna=True).startswith('mixed')
+    ]
+    if mixed_cols:
+        df = df.astype({col: 'string' for col in mixed_cols})
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def write_dataframe_csv(df, path, include_header=True):
+    """
+    Write a DataFrame to CSV with pyarrow's CSV writer.
+
+    Args:
+        df: DataFrame to write (index is not written)
+        path: Output CSV path or a file opened in binary mode
+        include_header: Whether to write the header row first
+    """
+    write_options = pacsv.WriteOptions(include_header=include_header)
+    pacsv.write_csv(to_arrow_table(df), path, write_options=write_options)
@@ -11,9 +11,16 @@ Borderline matches (80-89) are flagged for manual review.
 """
 
 import pandas as pd
+import numpy as np
 import os
-from fuzzywuzzy import process
+import glob
+import unicodedata
+from collections import Counter, defaultdict
+from rapidfuzz import process, fuzz, utils
+from scipy.optimize import linear_sum_assignment
 import re
+import shelve
+from csv_writer import write_dataframe_csv
 
 # Manual name corrections (from old script)
 NAME_CORRECTIONS = {
@@ -22,6 +29,28 @@ NAME_CORRECTIONS = {
     'Michael Friedl (M)': 'Mike Friedl (sr)'
 }
 
+COUNTRY_FILE = 'ATHLETE DATABASE SCRIPTS OLD/Clean Data/country_info_v2.csv'
+
+# Normalized athlete frames are cached here between runs
+CACHE_DIR = 'data/cache'
+SCORE_CACHE = f'{CACHE_DIR}/fuzzy_scores'
+
+# Columns read from the cleaned athlete CSVs: the matching keys plus the profile
+# fields carried through the unmatched-athlete outputs to merge_final_athletes.py
+PWA_COLUMNS = ['athlete_id', 'name', 'year_of_birth', 'nationality', 'sail_number', 'profile_url', 'sponsors']
+LH_COLUMNS = ['athlete_id', 'name', 'year_of_birth', 'nationality', 'image_url', 'dob']
+ATHLETE_DTYPES = {'year_of_birth': 'Int16', 'nationality': 'category'}
+
+# Scorer used for all fuzzy name comparisons. The stage thresholds (91/80/90)
+# and the 80-89 review band are calibrated against WRatio's token-set handling
+# of middle names and name order, so cheaper scorers are not a drop-in swap.
+NAME_SCORER = fuzz.WRatio
+
+# Stage 3 only scores pairs whose character bigrams overlap by at least this share
+# of the shorter name's bigrams. A WRatio of 90+ needs near-identical names or one
+# name contained in the other, both of which overlap far more than this.
+BIGRAM_OVERLAP_CUTOFF = 0.3
+
 def load_country_mapping():
     """
     Load country mapping CSV to normalize country names between PWA and LiveHeats.
@@ -29,7 +58,7 @@ def load_country_mapping():
     Returns:
         DataFrame with country mapping data
     """
-    country_file = 'ATHLETE DATABASE SCRIPTS OLD/Clean Data/country_info_v2.csv'
+    country_file = COUNTRY_FILE
 
     if not os.path.exists(country_file):
         print(f"WARNING: Country mapping file not found: {country_file}")
@@ -40,11 +69,166 @@ def load_country_mapping():
     print(f"[OK] Loaded country mapping: {len(df)} countries")
     return df
 
-def apply_name_corrections(name):
-    """Apply manual name corrections"""
-    if pd.notna(name) and name in NAME_CORRECTIONS:
-        return NAME_CORRECTIONS[name]
-    return name
+def name_key(name):
+    """
+    Build an exact-match key: accents folded to ASCII, lowercased, trimmed.
+
+    Args:
+        name: Athlete name
+
+    Returns:
+        Normalized name key (e.g. 'José Gomes ' -> 'jose gomes')
+    """
+    folded = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode()
+    return folded.lower().strip()
+
+def name_bigrams(name):
+    """
+    Character bigrams of a name, after the same preprocessing used for scoring.
+
+    Args:
+        name: Athlete name
+
+    Returns:
+        Set of 2-character strings (name is space-padded so word edges count)
+    """
+    padded = f' {utils.default_process(name)} '
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+def score_names(queries, choices, score_cutoff=None):
+    """
+    Score every query name against every choice name in a single batch.
+
+    Uses the same WRatio scorer and preprocessing as fuzzywuzzy's extractOne,
+    with scores rounded to integers. Scoring is spread across all CPU cores.
+
+    Args:
+        queries: List of names to match
+        choices: List of candidate names
+        score_cutoff: Scores that round below this are returned as 0
+            (lets the scorer exit early)
+
+    Returns:
+        2D numpy array of scores (rows = queries, columns = choices)
+    """
+    if score_cutoff is not None:
+        # Compare before rounding, so allow for scores that round up to the cutoff
+        score_cutoff -= 0.5
+
+    return process.cdist(
+        queries,
+        choices,
+        scorer=NAME_SCORER,
+        processor=utils.default_process,
+        score_cutoff=score_cutoff,
+        dtype=np.uint8,
+        workers=-1
+    )
+
+def score_names_cached(score_cache, cache_key, queries, choices, score_cutoff):
+    """
+    Score every query against every choice, reusing scores from the previous run.
+
+    The cache holds, per key, the names scored last time and their non-zero
+    scores. Only rows for new queries and columns for new choices go through
+    cdist; every other pair is folded back in from the cache.
+
+    Args:
+        score_cache: Open shelve of cached scores
+        cache_key: Name of this score matrix (e.g. 'stage1')
+        queries: List of names to match
+        choices: List of candidate names
+        score_cutoff: Scores that round below this are returned as 0
+
+    Returns:
+        2D numpy array of scores (rows = queries, columns = choices)
+    """
+    key = f'{NAME_SCORER.__name__}|{score_cutoff}|{cache_key}'
+    previous = score_cache.get(key, {'queries': set(), 'choices': set(), 'pairs': []})
+
+    scores = np.zeros((len(queries), len(choices)), dtype=np.uint8)
+    query_known = np.array([q in previous['queries'] for q in queries], dtype=bool)
+    choice_known = np.array([c in previous['choices'] for c in choices], dtype=bool)
+
+    # Fold in cached scores for pairs of names that were both scored last time
+    query_positions = defaultdict(list)
+    for pos, query in enumerate(queries):
+        query_positions[query].append(pos)
+    choice_positions = defaultdict(list)
+    for pos, choice in enumerate(choices):
+        choice_positions[choice].append(pos)
+    for query, choice, score in previous['pairs']:
+        if query in query_positions and choice in choice_positions:
+            scores[np.ix_(query_positions[query], choice_positions[choice])] = score
+
+    # Score new queries against all choices, and known queries against new choices
+    new_rows = np.flatnonzero(~query_known)
+    if len(new_rows) and len(choices):
+        scores[new_rows, :] = score_names([queries[i] for i in new_rows], choices, score_cutoff)
+    known_rows = np.flatnonzero(query_known)
+    new_cols = np.flatnonzero(~choice_known)
+    if len(known_rows) and len(new_cols):
+        scores[np.ix_(known_rows, new_cols)] = score_names(
+            [queries[i] for i in known_rows],
+            [choices[j] for j in new_cols],
+            score_cutoff
+        )
+
+    rows, cols = np.nonzero(scores)
+    score_cache[key] = {
+        'queries': set(queries),
+        'choices': set(choices),
+        'pairs': [(queries[i], choices[j], int(scores[i, j])) for i, j in zip(rows, cols)]
+    }
+
+    return scores
+
+def assign_matches(scores, threshold):
+    """
+    Pick the one-to-one pairs that maximize the total match score.
+
+    Unlike taking each row's best remaining candidate in turn, a PWA name is
+    not lost to an earlier LiveHeats row when it is the better match for a
+    later one.
+
+    Args:
+        scores: 2D score matrix (rows = LiveHeats, columns = PWA), 0 for non-candidates
+        threshold: Minimum score for a pair to count as a match
+
+    Returns:
+        Tuple of (rows, columns, scores) arrays for the matched pairs, ordered by row
+    """
+    if scores.size == 0:
+        empty = np.array([], dtype=np.intp)
+        return empty, empty, np.array([], dtype=scores.dtype)
+
+    rows, cols = linear_sum_assignment(scores.astype(np.int32), maximize=True)
+    keep = scores[rows, cols] >= threshold
+    return rows[keep], cols[keep], scores[rows[keep], cols[keep]]
+
+def build_matches(lh_df, pwa_df, lh_positions, pwa_positions, scores, stage):
+    """
+    Build a matches DataFrame from aligned arrays of matched row positions.
+
+    Args:
+        lh_df: LiveHeats DataFrame
+        pwa_df: PWA DataFrame
+        lh_positions: Row positions of the matched LiveHeats athletes
+        pwa_positions: Row positions of the matched PWA athletes (same order)
+        scores: Match score per pair (or a single score for all pairs)
+        stage: Name of the matching stage
+
+    Returns:
+        DataFrame with one row per match
+    """
+    return pd.DataFrame({
+        'lh_athlete_id': lh_df['athlete_id'].to_numpy()[lh_positions],
+        'lh_name': lh_df['name'].to_numpy()[lh_positions],
+        'pwa_athlete_id': pwa_df['athlete_id'].to_numpy()[pwa_positions],
+        'pwa_name': pwa_df['name'].to_numpy()[pwa_positions],
+        'score': scores,
+        'stage': stage
+    })
 
 def normalize_pwa_data(pwa_df, country_df):
     """
@@ -62,13 +246,23 @@ def normalize_pwa_data(pwa_df, country_df):
     df = pwa_df.copy()
 
     # Apply name corrections
-    df['name'] = df['name'].apply(apply_name_corrections)
+    df['name'] = df['name'].replace(NAME_CORRECTIONS)
 
     # Join with country data to get standardized country info
     if country_df is not None:
+        countries = country_df[['pwa_demonyms', 'Name', 'ISO Alpha-3', 'live_heats_nationality']].copy()
+
+        # Use categorical join keys with a shared category set so the merge hashes integer codes
+        demonyms = pd.api.types.union_categoricals([
+            pd.Categorical(df['nationality']),
+            pd.Categorical(countries['pwa_demonyms'])
+        ]).categories
+        df['nationality'] = pd.Categorical(df['nationality'], categories=demonyms)
+        countries['pwa_demonyms'] = pd.Categorical(countries['pwa_demonyms'], categories=demonyms)
+
         # Match PWA nationality (demonym) to country mapping
         df = df.merge(
-            country_df[['pwa_demonyms', 'Name', 'ISO Alpha-3', 'live_heats_nationality']],
+            countries,
             left_on='nationality',
             right_on='pwa_demonyms',
             how='left'
@@ -96,7 +290,41 @@ def normalize_liveheats_data(lh_df):
     df = lh_df.copy()
 
     # Apply name corrections
-    df['name'] = df['name'].apply(apply_name_corrections)
+    df['name'] = df['name'].replace(NAME_CORRECTIONS)
+
+    return df
+
+def load_normalized(name, source_files, build):
+    """
+    Load a normalized athlete frame from the Parquet cache, rebuilding it when stale.
+
+    The cache key is the modification time of every source file (plus this
+    script), so editing an input CSV, the country mapping or NAME_CORRECTIONS
+    invalidates it.
+
+    Args:
+        name: Cache name prefix (e.g. 'pwa')
+        source_files: Files the normalized frame is derived from
+        build: Function that loads and normalizes the frame on a cache miss
+
+    Returns:
+        Normalized DataFrame with a RangeIndex (row labels equal positions)
+    """
+    stamps = [str(int(os.path.getmtime(f))) for f in source_files + [__file__] if os.path.exists(f)]
+    cache_path = f"{CACHE_DIR}/{name}_normalized_{'_'.join(stamps)}.parquet"
+
+    if os.path.exists(cache_path):
+        df = pd.read_parquet(cache_path)
+        print(f"\n[OK] Loaded cached normalized data: {cache_path}")
+        return df
+
+    df = build().reset_index(drop=True)
+
+    # Replace any stale cache for this source
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    for stale in glob.glob(f'{CACHE_DIR}/{name}_normalized_*.parquet'):
+        os.remove(stale)
+    df.to_parquet(cache_path, index=False)
 
     return df
 
@@ -110,179 +338,214 @@ def match_stage1_exact_and_fuzzy(lh_df, pwa_df, threshold=91):
         threshold: Minimum fuzzy match score (default 91)
 
     Returns:
-        Tuple of (matches_df, matched_pwa_indices, matched_lh_indices)
+        Tuple of (matches_df, matched_pwa_mask, matched_lh_mask), masks by row position
     """
     print(f"\nStage 1: Exact + Fuzzy Match (>={threshold}%)")
 
-    matches = []
-    matched_pwa_idx = set()
-    matched_lh_idx = set()
-
-    pwa_names = pwa_df['name'].tolist()
-    pwa_available = pwa_df.copy()
-
-    for idx, lh_row in lh_df.iterrows():
-        lh_name = lh_row['name']
-
-        if pd.isna(lh_name):
-            continue
-
-        # Try exact match first
-        exact_match = pwa_available[pwa_available['name'] == lh_name]
-
-        if not exact_match.empty:
-            pwa_row = exact_match.iloc[0]
-            matches.append({
-                'lh_athlete_id': lh_row['athlete_id'],
-                'lh_name': lh_name,
-                'pwa_athlete_id': pwa_row['athlete_id'],
-                'pwa_name': pwa_row['name'],
-                'score': 100,
-                'stage': 'Exact'
-            })
-            matched_pwa_idx.add(pwa_row.name)
-            matched_lh_idx.add(idx)
-            pwa_available = pwa_available[pwa_available.index != pwa_row.name]
-            continue
+    matched_pwa = np.zeros(len(pwa_df), dtype=bool)
+    matched_lh = np.zeros(len(lh_df), dtype=bool)
+
+    lh_names = lh_df['name'].to_numpy()
+    pwa_names = pwa_df['name'].to_numpy()
+
+    # Exact matches on normalized name: the k-th LiveHeats athlete with a given
+    # name pairs with the k-th PWA athlete with it, so each athlete is used once
+    lh_keys = lh_df['name'].dropna().map(name_key)
+    pwa_keys = pwa_df['name'].dropna().map(name_key)
+    exact = pd.DataFrame({
+        'key': lh_keys.to_numpy(),
+        'nth': lh_keys.groupby(lh_keys).cumcount().to_numpy(),
+        'lh_pos': np.flatnonzero(lh_df['name'].notna())
+    }).merge(pd.DataFrame({
+        'key': pwa_keys.to_numpy(),
+        'nth': pwa_keys.groupby(pwa_keys).cumcount().to_numpy(),
+        'pwa_pos': np.flatnonzero(pwa_df['name'].notna())
+    }), on=['key', 'nth']).sort_values('lh_pos')
+
+    exact_lh = exact['lh_pos'].to_numpy()
+    exact_pwa = exact['pwa_pos'].to_numpy()
+    exact_matches = build_matches(lh_df, pwa_df, exact_lh, exact_pwa, 100, 'Exact')
+    matched_lh[exact_lh] = True
+    matched_pwa[exact_pwa] = True
+
+    # Fuzzy matches among the remaining named athletes
+    lh_rest = np.flatnonzero(~matched_lh & lh_df['name'].notna().to_numpy())
+    pwa_rest = np.flatnonzero(~matched_pwa & pwa_df['name'].notna().to_numpy())
+
+    with shelve.open(SCORE_CACHE) as score_cache:
+        scores = score_names_cached(
+            score_cache,
+            'stage1',
+            lh_names[lh_rest].tolist(),
+            pwa_names[pwa_rest].tolist(),
+            score_cutoff=threshold
+        )
 
-        # Try fuzzy match
-        if len(pwa_available) > 0:
-            available_names = pwa_available['name'].dropna().tolist()
-            if len(available_names) > 0:
-                best_match, score = process.extractOne(lh_name, available_names)
-
-                if score >= threshold:
-                    pwa_row = pwa_available[pwa_available['name'] == best_match].iloc[0]
-                    matches.append({
-                        'lh_athlete_id': lh_row['athlete_id'],
-                        'lh_name': lh_name,
-                        'pwa_athlete_id': pwa_row['athlete_id'],
-                        'pwa_name': best_match,
-                        'score': score,
-                        'stage': f'Fuzzy{threshold}'
-                    })
-                    matched_pwa_idx.add(pwa_row.name)
-                    matched_lh_idx.add(idx)
-                    pwa_available = pwa_available[pwa_available.index != pwa_row.name]
+    lh_pos, pwa_pos, match_scores = assign_matches(scores, threshold)
+    lh_pos, pwa_pos = lh_rest[lh_pos], pwa_rest[pwa_pos]
+    fuzzy_matches = build_matches(lh_df, pwa_df, lh_pos, pwa_pos, match_scores, f'Fuzzy{threshold}')
+    matched_lh[lh_pos] = True
+    matched_pwa[pwa_pos] = True
 
+    matches = pd.concat([exact_matches, fuzzy_matches], ignore_index=True)
     print(f"  [OK] Found {len(matches)} matches")
-    return pd.DataFrame(matches), matched_pwa_idx, matched_lh_idx
+    return matches, matched_pwa, matched_lh
 
-def match_stage2_yob(lh_df, pwa_df, matched_pwa_idx, matched_lh_idx, threshold=80):
+def match_stage2_yob(lh_df, pwa_df, matched_pwa, matched_lh, threshold=80):
     """
     Stage 2: Year of birth +/-1 + fuzzy match (>=80%)
 
     Args:
         lh_df: LiveHeats DataFrame
         pwa_df: PWA DataFrame
-        matched_pwa_idx: Set of already matched PWA indices
-        matched_lh_idx: Set of already matched LiveHeats indices
+        matched_pwa: Boolean mask of already matched PWA rows (by position)
+        matched_lh: Boolean mask of already matched LiveHeats rows (by position)
         threshold: Minimum fuzzy match score (default 80)
 
     Returns:
-        Tuple of (matches_df, new_matched_pwa_indices, new_matched_lh_indices)
+        Tuple of (matches_df, new_matched_pwa_mask, new_matched_lh_mask), masks by row position
     """
     print(f"\nStage 2: Year of Birth +/-1 + Fuzzy Match (>={threshold}%)")
 
-    matches = []
-    new_matched_pwa = set()
-    new_matched_lh = set()
-
-    pwa_available = pwa_df[~pwa_df.index.isin(matched_pwa_idx)].copy()
-    lh_available = lh_df[~lh_df.index.isin(matched_lh_idx)].copy()
-
-    for idx, lh_row in lh_available.iterrows():
-        lh_name = lh_row['name']
-        lh_yob = lh_row.get('year_of_birth')
-
-        if pd.isna(lh_name) or pd.isna(lh_yob):
-            continue
-
-        # Filter PWA athletes with YOB +/-1
-        pwa_yob_match = pwa_available[
-            (pwa_available['year_of_birth'].notna()) &
-            (abs(pwa_available['year_of_birth'] - lh_yob) <= 1)
-        ]
-
-        if len(pwa_yob_match) > 0:
-            yob_names = pwa_yob_match['name'].dropna().tolist()
-            if len(yob_names) > 0:
-                best_match, score = process.extractOne(lh_name, yob_names)
-
-                if score >= threshold:
-                    pwa_row = pwa_yob_match[pwa_yob_match['name'] == best_match].iloc[0]
-                    matches.append({
-                        'lh_athlete_id': lh_row['athlete_id'],
-                        'lh_name': lh_name,
-                        'pwa_athlete_id': pwa_row['athlete_id'],
-                        'pwa_name': best_match,
-                        'score': score,
-                        'stage': 'YOB+/-1'
-                    })
-                    new_matched_pwa.add(pwa_row.name)
-                    new_matched_lh.add(idx)
+    new_matched_pwa = np.zeros(len(pwa_df), dtype=bool)
+    new_matched_lh = np.zeros(len(lh_df), dtype=bool)
+
+    # Positions of the remaining athletes in pwa_df / lh_df
+    pwa_remaining = np.flatnonzero(~matched_pwa & pwa_df['name'].notna().to_numpy())
+    lh_remaining = np.flatnonzero(~matched_lh)
+    pwa_available = pwa_df.iloc[pwa_remaining]
+    lh_available = lh_df.iloc[lh_remaining]
+
+    pwa_names = pwa_available['name'].tolist()
+    lh_names = lh_available['name'].tolist()
+
+    # Years of birth as float arrays (NaN for missing, which fails every window test)
+    pwa_yobs = pwa_available['year_of_birth'].to_numpy(dtype=np.float64, na_value=np.nan)
+    lh_yobs = lh_available['year_of_birth'].to_numpy(dtype=np.float64, na_value=np.nan)
+    lh_valid = lh_available['name'].notna().to_numpy() & ~np.isnan(lh_yobs)
+
+    # Score each LiveHeats YOB group against the PWA athletes inside its YOB +/-1 window
+    scores = np.zeros((len(lh_available), len(pwa_available)), dtype=np.uint8)
+    with shelve.open(SCORE_CACHE) as score_cache:
+        for yob in np.unique(lh_yobs[lh_valid]):
+            lh_positions = np.flatnonzero(lh_valid & (lh_yobs == yob))
+            candidates = np.flatnonzero(np.abs(pwa_yobs - yob) <= 1)
+            if len(candidates) == 0:
+                continue
+            group_scores = score_names_cached(
+                score_cache,
+                f'stage2_yob{int(yob)}',
+                [lh_names[p] for p in lh_positions],
+                [pwa_names[c] for c in candidates],
+                score_cutoff=threshold
+            )
+            scores[np.ix_(lh_positions, candidates)] = group_scores
+
+    lh_pos, pwa_pos, match_scores = assign_matches(scores, threshold)
+    lh_pos, pwa_pos = lh_remaining[lh_pos], pwa_remaining[pwa_pos]
+    matches = build_matches(lh_df, pwa_df, lh_pos, pwa_pos, match_scores, 'YOB+/-1')
+    new_matched_lh[lh_pos] = True
+    new_matched_pwa[pwa_pos] = True
 
     print(f"  [OK] Found {len(matches)} matches")
-    return pd.DataFrame(matches), new_matched_pwa, new_matched_lh
+    return matches, new_matched_pwa, new_matched_lh
 
-def match_stage3_country(lh_df, pwa_df, matched_pwa_idx, matched_lh_idx, threshold=90):
+def match_stage3_country(lh_df, pwa_df, matched_pwa, matched_lh, threshold=90):
     """
     Stage 3: Country match + fuzzy name match (>=90%)
 
     Args:
         lh_df: LiveHeats DataFrame
         pwa_df: PWA DataFrame with normalized country data
-        matched_pwa_idx: Set of already matched PWA indices
-        matched_lh_idx: Set of already matched LiveHeats indices
+        matched_pwa: Boolean mask of already matched PWA rows (by position)
+        matched_lh: Boolean mask of already matched LiveHeats rows (by position)
         threshold: Minimum fuzzy match score (default 90)
 
     Returns:
-        Tuple of (matches_df, new_matched_pwa_indices, new_matched_lh_indices)
+        Tuple of (matches_df, new_matched_pwa_mask, new_matched_lh_mask), masks by row position
     """
     print(f"\nStage 3: Country + Name Match (>={threshold}%)")
 
-    matches = []
-    new_matched_pwa = set()
-    new_matched_lh = set()
-
-    pwa_available = pwa_df[~pwa_df.index.isin(matched_pwa_idx)].copy()
-    lh_available = lh_df[~lh_df.index.isin(matched_lh_idx)].copy()
+    new_matched_pwa = np.zeros(len(pwa_df), dtype=bool)
+    new_matched_lh = np.zeros(len(lh_df), dtype=bool)
+
+    # Positions of the remaining athletes in pwa_df / lh_df
+    pwa_remaining = np.flatnonzero(~matched_pwa & pwa_df['name'].notna().to_numpy())
+    lh_remaining = np.flatnonzero(~matched_lh)
+    pwa_available = pwa_df.iloc[pwa_remaining]
+    lh_available = lh_df.iloc[lh_remaining]
+
+    pwa_names = pwa_available['name'].tolist()
+    lh_names = lh_available['name'].tolist()
+    lh_nats = lh_available['nationality'].tolist()
+
+    # Bucket PWA positions by country (under both LiveHeats-style and PWA nationality)
+    country_buckets = defaultdict(list)
+    pwa_nat_pairs = zip(pwa_available['live_heats_nationality'], pwa_available['nationality'])
+    for pwa_pos, (lh_style_nat, pwa_nat) in enumerate(pwa_nat_pairs):
+        if pd.notna(lh_style_nat):
+            country_buckets[lh_style_nat].append(pwa_pos)
+        if pd.notna(pwa_nat) and pwa_nat != lh_style_nat:
+            country_buckets[pwa_nat].append(pwa_pos)
+
+    # One inverted index per country bucket, from bigram to PWA positions, for
+    # cheap candidate prefiltering
+    pwa_bigrams = [name_bigrams(n) for n in pwa_names]
+    bucket_indexes = {}
+    for nat, bucket in country_buckets.items():
+        bigram_index = defaultdict(list)
+        for pwa_pos in bucket:
+            for gram in pwa_bigrams[pwa_pos]:
+                bigram_index[gram].append(pwa_pos)
+        bucket_indexes[nat] = bigram_index
+
+    # Group LiveHeats rows by nationality
+    lh_groups = defaultdict(list)
+    for lh_pos, (lh_name, lh_nat) in enumerate(zip(lh_names, lh_nats)):
+        if pd.notna(lh_name) and pd.notna(lh_nat) and lh_nat in bucket_indexes:
+            lh_groups[lh_nat].append(lh_pos)
+
+    # Score each nationality group in one batch against the union of its rows'
+    # candidates, keeping only pairs that share enough bigrams
+    scores = np.zeros((len(lh_available), len(pwa_available)), dtype=np.uint8)
+    for lh_nat, lh_positions in lh_groups.items():
+        bigram_index = bucket_indexes[lh_nat]
+        row_candidates = []
+        for lh_pos in lh_positions:
+            lh_grams = name_bigrams(lh_names[lh_pos])
+            shared = Counter(pwa_pos for gram in lh_grams for pwa_pos in bigram_index.get(gram, ()))
+            row_candidates.append([
+                pwa_pos for pwa_pos, n in shared.items()
+                if n / min(len(lh_grams), len(pwa_bigrams[pwa_pos])) >= BIGRAM_OVERLAP_CUTOFF
+            ])
+
+        candidates = np.array(sorted(set().union(*row_candidates)), dtype=np.intp)
+        if len(candidates) == 0:
+            continue
 
-    for idx, lh_row in lh_available.iterrows():
-        lh_name = lh_row['name']
-        lh_nationality = lh_row.get('nationality')
+        # Mask of prefiltered pairs within the group's score block
+        column = {pwa_pos: i for i, pwa_pos in enumerate(candidates)}
+        keep = np.zeros((len(lh_positions), len(candidates)), dtype=bool)
+        for row, pwa_positions in enumerate(row_candidates):
+            keep[row, [column[pwa_pos] for pwa_pos in pwa_positions]] = True
 
-        if pd.isna(lh_name) or pd.isna(lh_nationality):
-            continue
+        group_scores = score_names(
+            [lh_names[p] for p in lh_positions],
+            [pwa_names[c] for c in candidates],
+            score_cutoff=threshold
+        )
+        scores[np.ix_(lh_positions, candidates)] = np.where(keep, group_scores, 0)
 
-        # Filter PWA athletes from same country
-        pwa_country_match = pwa_available[
-            (pwa_available['live_heats_nationality'] == lh_nationality) |
-            (pwa_available['nationality'] == lh_nationality)
-        ]
-
-        if len(pwa_country_match) > 0:
-            country_names = pwa_country_match['name'].dropna().tolist()
-            if len(country_names) > 0:
-                best_match, score = process.extractOne(lh_name, country_names)
-
-                if score >= threshold:
-                    pwa_row = pwa_country_match[pwa_country_match['name'] == best_match].iloc[0]
-                    matches.append({
-                        'lh_athlete_id': lh_row['athlete_id'],
-                        'lh_name': lh_name,
-                        'pwa_athlete_id': pwa_row['athlete_id'],
-                        'pwa_name': best_match,
-                        'score': score,
-                        'stage': 'CountryMatch'
-                    })
-                    new_matched_pwa.add(pwa_row.name)
-                    new_matched_lh.add(idx)
+    lh_pos, pwa_pos, match_scores = assign_matches(scores, threshold)
+    lh_pos, pwa_pos = lh_remaining[lh_pos], pwa_remaining[pwa_pos]
+    matches = build_matches(lh_df, pwa_df, lh_pos, pwa_pos, match_scores, 'CountryMatch')
+    new_matched_lh[lh_pos] = True
+    new_matched_pwa[pwa_pos] = True
 
     print(f"  [OK] Found {len(matches)} matches")
-    return pd.DataFrame(matches), new_matched_pwa, new_matched_lh
+    return matches, new_matched_pwa, new_matched_lh
 
-def create_output_files(all_matches_df, pwa_df, lh_df, matched_pwa_idx, matched_lh_idx):
+def create_output_files(all_matches_df, pwa_df, lh_df, matched_pwa, matched_lh):
     """
     Create output CSV files for different match categories.
 
@@ -290,8 +553,8 @@ def create_output_files(all_matches_df, pwa_df, lh_df, matched_pwa_idx, matched_
         all_matches_df: DataFrame with all matches
         pwa_df: PWA athletes DataFrame
         lh_df: LiveHeats athletes DataFrame
-        matched_pwa_idx: Set of matched PWA indices
-        matched_lh_idx: Set of matched LiveHeats indices
+        matched_pwa: Boolean mask of matched PWA rows (by position)
+        matched_lh: Boolean mask of matched LiveHeats rows (by position)
     """
     print("\nCreating output files...")
 
@@ -300,7 +563,7 @@ def create_output_files(all_matches_df, pwa_df, lh_df, matched_pwa_idx, matched_
 
     # 1. All matches
     matches_file = f'{output_dir}/athletes_matched.csv'
-    all_matches_df.to_csv(matches_file, index=False)
+    write_dataframe_csv(all_matches_df, matches_file)
     print(f"  [OK] All matches: {matches_file} ({len(all_matches_df)} records)")
 
     # 2. Borderline matches (80-89) for manual review
@@ -309,19 +572,19 @@ def create_output_files(all_matches_df, pwa_df, lh_df, matched_pwa_idx, matched_
         (all_matches_df['score'] < 90)
     ].copy()
     review_file = f'{output_dir}/athletes_needs_review.csv'
-    needs_review.to_csv(review_file, index=False)
+    write_dataframe_csv(needs_review, review_file)
     print(f"  [OK] Needs review (80-89%): {review_file} ({len(needs_review)} records)")
 
     # 3. PWA-only athletes (unmatched)
-    pwa_only = pwa_df[~pwa_df.index.isin(matched_pwa_idx)].copy()
+    pwa_only = pwa_df[~matched_pwa]
     pwa_only_file = f'{output_dir}/athletes_pwa_only.csv'
-    pwa_only.to_csv(pwa_only_file, index=False)
+    write_dataframe_csv(pwa_only, pwa_only_file)
     print(f"  [OK] PWA-only: {pwa_only_file} ({len(pwa_only)} records)")
 
     # 4. LiveHeats-only athletes (unmatched)
-    lh_only = lh_df[~lh_df.index.isin(matched_lh_idx)].copy()
+    lh_only = lh_df[~matched_lh]
     lh_only_file = f'{output_dir}/athletes_liveheats_only.csv'
-    lh_only.to_csv(lh_only_file, index=False)
+    write_dataframe_csv(lh_only, lh_only_file)
     print(f"  [OK] LiveHeats-only: {lh_only_file} ({len(lh_only)} records)")
 
 def main():
@@ -343,47 +606,42 @@ def main():
         print("Please run scrape_liveheats_athlete_profiles.py first.")
         return
 
-    pwa_df = pd.read_csv(pwa_file)
-    lh_df = pd.read_csv(lh_file)
+    # Load and normalize data (reusing the cached result when inputs are unchanged)
+    pwa_df = load_normalized('pwa', [pwa_file, COUNTRY_FILE], lambda: normalize_pwa_data(
+        pd.read_csv(pwa_file, usecols=lambda c: c in PWA_COLUMNS, dtype=ATHLETE_DTYPES),
+        load_country_mapping()
+    ))
+    lh_df = load_normalized('liveheats', [lh_file], lambda: normalize_liveheats_data(
+        pd.read_csv(lh_file, usecols=lambda c: c in LH_COLUMNS, dtype=ATHLETE_DTYPES)
+    ))
 
     print(f"\n[OK] Loaded PWA athletes: {len(pwa_df)}")
     print(f"[OK] Loaded LiveHeats athletes: {len(lh_df)}")
 
-    # Load country mapping
-    country_df = load_country_mapping()
-
-    # Normalize data
-    pwa_df = normalize_pwa_data(pwa_df, country_df)
-    lh_df = normalize_liveheats_data(lh_df)
-
     # Run matching stages
     all_matches = []
-    matched_pwa_idx = set()
-    matched_lh_idx = set()
 
     # Stage 1: Exact + Fuzzy >=91%
-    stage1_matches, new_pwa, new_lh = match_stage1_exact_and_fuzzy(lh_df, pwa_df, threshold=91)
+    stage1_matches, matched_pwa, matched_lh = match_stage1_exact_and_fuzzy(lh_df, pwa_df, threshold=91)
     all_matches.append(stage1_matches)
-    matched_pwa_idx.update(new_pwa)
-    matched_lh_idx.update(new_lh)
 
     # Stage 2: YOB +/-1 + Fuzzy >=80%
-    stage2_matches, new_pwa, new_lh = match_stage2_yob(lh_df, pwa_df, matched_pwa_idx, matched_lh_idx, threshold=80)
+    stage2_matches, new_pwa, new_lh = match_stage2_yob(lh_df, pwa_df, matched_pwa, matched_lh, threshold=80)
     all_matches.append(stage2_matches)
-    matched_pwa_idx.update(new_pwa)
-    matched_lh_idx.update(new_lh)
+    matched_pwa |= new_pwa
+    matched_lh |= new_lh
 
     # Stage 3: Country + Fuzzy >=90%
-    stage3_matches, new_pwa, new_lh = match_stage3_country(lh_df, pwa_df, matched_pwa_idx, matched_lh_idx, threshold=90)
+    stage3_matches, new_pwa, new_lh = match_stage3_country(lh_df, pwa_df, matched_pwa, matched_lh, threshold=90)
     all_matches.append(stage3_matches)
-    matched_pwa_idx.update(new_pwa)
-    matched_lh_idx.update(new_lh)
+    matched_pwa |= new_pwa
+    matched_lh |= new_lh
 
     # Combine all matches
     all_matches_df = pd.concat(all_matches, ignore_index=True)
 
     # Create output files
-    create_output_files(all_matches_df, pwa_df, lh_df, matched_pwa_idx, matched_lh_idx)
+    create_output_files(all_matches_df, pwa_df, lh_df, matched_pwa, matched_lh)
 
     # Print summary
     print("\n" + "=" * 50)
@@ -395,8 +653,8 @@ def main():
     print(f"  - YOB+/-1: {len(all_matches_df[all_matches_df['stage'] == 'YOB+/-1'])}")
     print(f"  - CountryMatch: {len(all_matches_df[all_matches_df['stage'] == 'CountryMatch'])}")
     print(f"\nNeeds manual review (80-89%): {len(all_matches_df[(all_matches_df['score'] >= 80) & (all_matches_df['score'] < 90)])}")
-    print(f"Unmatched PWA: {len(pwa_df) - len(matched_pwa_idx)}")
-    print(f"Unmatched LiveHeats: {len(lh_df) - len(matched_lh_idx)}")
+    print(f"Unmatched PWA: {len(pwa_df) - matched_pwa.sum()}")
+    print(f"Unmatched LiveHeats: {len(lh_df) - matched_lh.sum()}")
 
 if __name__ == "__main__":
     main()
@@ -13,7 +13,28 @@ Outputs:
 """
 
 import pandas as pd
+import numpy as np
 import os
+from csv_writer import write_dataframe_csv
+
+# Column layout of athletes_final.csv (after the unified 'id' column)
+ATHLETE_COLUMNS = [
+    'lh_athlete_id', 'pwa_athlete_id', 'lh_name', 'pwa_name', 'match_score', 'match_stage',
+    'lh_image_url', 'lh_dob', 'lh_nationality', 'lh_year_of_birth',
+    'pwa_sail_number', 'pwa_profile_url', 'pwa_nationality', 'pwa_sponsors', 'pwa_year_of_birth',
+    'primary_name', 'year_of_birth', 'nationality',
+]
+
+# Profile columns used from each source's athlete CSVs
+PWA_COLUMNS = ['athlete_id', 'name', 'year_of_birth', 'nationality', 'sail_number', 'profile_url', 'sponsors']
+LH_COLUMNS = ['athlete_id', 'name', 'year_of_birth', 'nationality', 'image_url', 'dob']
+
+# Columns joined onto matched athletes in merge_athlete_data (names come from the matches)
+PWA_PROFILE_COLUMNS = ['athlete_id', 'sail_number', 'profile_url', 'nationality', 'sponsors', 'year_of_birth']
+LH_PROFILE_COLUMNS = ['athlete_id', 'image_url', 'dob', 'nationality', 'year_of_birth']
+
+# Identifier columns that can be numeric in one source CSV and text in another
+ID_COLUMNS = ['lh_athlete_id', 'pwa_athlete_id', 'pwa_sail_number']
 
 def load_manual_decisions():
     """
@@ -46,46 +67,21 @@ def merge_athlete_data(matches_df, pwa_df, lh_df):
     """
     print("\nMerging athlete profile data...")
 
-    # Join matches with LiveHeats data
-    merged = matches_df.merge(
-        lh_df,
-        left_on='lh_athlete_id',
-        right_on='athlete_id',
-        how='left',
-        suffixes=('', '_lh')
-    )
+    # Project each source to the profile columns kept below, prefixed so the
+    # ID columns line up with the match keys and the rest with the output names
+    lh_profiles = lh_df.reindex(columns=LH_PROFILE_COLUMNS).add_prefix('lh_')
+    pwa_profiles = pwa_df.reindex(columns=PWA_PROFILE_COLUMNS).add_prefix('pwa_')
 
-    # Join with PWA data
-    merged = merged.merge(
-        pwa_df,
-        left_on='pwa_athlete_id',
-        right_on='athlete_id',
-        how='left',
-        suffixes=('_lh', '_pwa')
+    merged = (
+        matches_df
+        .merge(lh_profiles, on='lh_athlete_id', how='left')
+        .merge(pwa_profiles, on='pwa_athlete_id', how='left')
     )
 
     # Select and rename key columns
-    final = pd.DataFrame({
-        'lh_athlete_id': merged['lh_athlete_id'],
-        'pwa_athlete_id': merged['pwa_athlete_id'],
-        'lh_name': merged['lh_name'],
-        'pwa_name': merged['pwa_name'],
-        'match_score': merged['score'],
-        'match_stage': merged['stage'],
-
-        # LiveHeats data
-        'lh_image_url': merged.get('image_url'),
-        'lh_dob': merged.get('dob'),
-        'lh_nationality': merged.get('nationality_lh'),
-        'lh_year_of_birth': merged.get('year_of_birth_lh'),
-
-        # PWA data
-        'pwa_sail_number': merged.get('sail_number'),
-        'pwa_profile_url': merged.get('profile_url'),
-        'pwa_nationality': merged.get('nationality_pwa'),
-        'pwa_sponsors': merged.get('sponsors'),
-        'pwa_year_of_birth': merged.get('year_of_birth_pwa'),
-    })
+    final = merged.rename(columns={'score': 'match_score', 'stage': 'match_stage'}).reindex(
+        columns=ATHLETE_COLUMNS[:ATHLETE_COLUMNS.index('primary_name')]
+    )
 
     # Determine primary name (prefer LiveHeats if available, fallback to PWA)
     final['primary_name'] = final['lh_name'].fillna(final['pwa_name'])
@@ -106,11 +102,11 @@ def create_pwa_only_records(pwa_only_df):
         pwa_only_df: DataFrame with unmatched PWA athletes
 
     Returns:
-        DataFrame with athlete records
+        Dict of athlete columns (Series, or scalars for constant columns)
     """
     print(f"\nCreating records for {len(pwa_only_df)} PWA-only athletes...")
 
-    records = pd.DataFrame({
+    records = {
         'lh_athlete_id': None,
         'pwa_athlete_id': pwa_only_df['athlete_id'],
         'lh_name': None,
@@ -135,7 +131,7 @@ def create_pwa_only_records(pwa_only_df):
         'primary_name': pwa_only_df['name'],
         'year_of_birth': pwa_only_df.get('year_of_birth'),
         'nationality': pwa_only_df['nationality'],
-    })
+    }
 
     return records
 
@@ -147,11 +143,11 @@ def create_liveheats_only_records(lh_only_df):
         lh_only_df: DataFrame with unmatched LiveHeats athletes
 
     Returns:
-        DataFrame with athlete records
+        Dict of athlete columns (Series, or scalars for constant columns)
     """
     print(f"\nCreating records for {len(lh_only_df)} LiveHeats-only athletes...")
 
-    records = pd.DataFrame({
+    records = {
         'lh_athlete_id': lh_only_df['athlete_id'],
         'pwa_athlete_id': None,
         'lh_name': lh_only_df['name'],
@@ -176,10 +172,40 @@ def create_liveheats_only_records(lh_only_df):
         'primary_name': lh_only_df['name'],
         'year_of_birth': lh_only_df.get('year_of_birth'),
         'nationality': lh_only_df.get('nationality'),
-    })
+    }
 
     return records
 
+def combine_athlete_records(record_sets):
+    """
+    Build the final athlete table from matched, PWA-only and LiveHeats-only records.
+
+    Each output column is allocated once and filled from the record sets in
+    order, instead of building one DataFrame per set and concatenating them.
+    ID_COLUMNS are cast to pandas' string dtype so that a numeric-only source
+    CSV cannot leave them holding a mix of ints and strings.
+
+    Args:
+        record_sets: List of (records, row_count) tuples, where records maps
+            column name to a Series or a scalar constant
+
+    Returns:
+        DataFrame with unified 'id' column followed by ATHLETE_COLUMNS
+    """
+    total = sum(count for _, count in record_sets)
+
+    columns = {'id': np.arange(1, total + 1)}
+    for col in ATHLETE_COLUMNS:
+        values = np.empty(total, dtype=object)
+        start = 0
+        for records, count in record_sets:
+            value = records.get(col)
+            values[start:start + count] = value.to_numpy() if isinstance(value, pd.Series) else value
+            start += count
+        columns[col] = pd.Series(values).astype('string') if col in ID_COLUMNS else values
+
+    return pd.DataFrame(columns)
+
 def create_link_table(athletes_df):
     """
     Create link table mapping unified athlete IDs to source-specific IDs.
@@ -192,36 +218,27 @@ def create_link_table(athletes_df):
     """
     print("\nCreating link table...")
 
-    links = []
-
-    for _, row in athletes_df.iterrows():
-        athlete_id = row['id']
-
-        # Add LiveHeats ID if present
-        if pd.notna(row['lh_athlete_id']):
-            links.append({
-                'athlete_id': athlete_id,
-                'source': 'Live Heats',
-                'source_id': str(row['lh_athlete_id'])
-            })
-
-        # Add PWA ID if present
-        if pd.notna(row['pwa_athlete_id']):
-            links.append({
-                'athlete_id': athlete_id,
-                'source': 'PWA',
-                'source_id': str(row['pwa_athlete_id'])
-            })
-
-        # Add PWA sail number if different from athlete_id
-        if pd.notna(row['pwa_sail_number']) and str(row['pwa_sail_number']) != str(row['pwa_athlete_id']):
-            links.append({
-                'athlete_id': athlete_id,
-                'source': 'PWA_sail_number',
-                'source_id': str(row['pwa_sail_number'])
-            })
-
-    link_df = pd.DataFrame(links)
+    def source_links(mask, id_col, source):
+        links = athletes_df.loc[mask, ['id', id_col]]
+        return pd.DataFrame({
+            'athlete_id': links['id'],
+            'source': source,
+            'source_id': links[id_col].astype(str)
+        })
+
+    # PWA sail number is only linked when it differs from the PWA athlete ID
+    sail_differs = (
+        athletes_df['pwa_sail_number'].notna() &
+        (athletes_df['pwa_sail_number'].astype(str) != athletes_df['pwa_athlete_id'].astype(str))
+    )
+
+    # Stable sort keeps each athlete's links together in LiveHeats, PWA, sail number order
+    link_df = pd.concat([
+        source_links(athletes_df['lh_athlete_id'].notna(), 'lh_athlete_id', 'Live Heats'),
+        source_links(athletes_df['pwa_athlete_id'].notna(), 'pwa_athlete_id', 'PWA'),
+        source_links(sail_differs, 'pwa_sail_number', 'PWA_sail_number')
+    ]).sort_values('athlete_id', kind='stable', ignore_index=True)
+
     print(f"  [OK] Created {len(link_df)} link records")
 
     return link_df
@@ -246,10 +263,10 @@ def main():
             return
 
     matches_df = pd.read_csv(matches_file)
-    pwa_df = pd.read_csv(pwa_file)
-    lh_df = pd.read_csv(lh_file)
-    pwa_only_df = pd.read_csv(pwa_only_file)
-    lh_only_df = pd.read_csv(lh_only_file)
+    pwa_df = pd.read_csv(pwa_file, usecols=lambda c: c in PWA_COLUMNS)
+    lh_df = pd.read_csv(lh_file, usecols=lambda c: c in LH_COLUMNS)
+    pwa_only_df = pd.read_csv(pwa_only_file, usecols=lambda c: c in PWA_COLUMNS)
+    lh_only_df = pd.read_csv(lh_only_file, usecols=lambda c: c in LH_COLUMNS)
 
     print(f"[OK] Loaded matches: {len(matches_df)}")
     print(f"[OK] Loaded PWA athletes: {len(pwa_df)}")
@@ -288,19 +305,12 @@ def main():
     pwa_only_records = create_pwa_only_records(pwa_only_df)
     lh_only_records = create_liveheats_only_records(lh_only_df)
 
-    # Combine all athlete records
-    all_athletes = pd.concat([
-        matched_athletes,
-        pwa_only_records,
-        lh_only_records
-    ], ignore_index=True)
-
-    # Assign unified athlete IDs (auto-increment starting from 1)
-    all_athletes['id'] = range(1, len(all_athletes) + 1)
-
-    # Reorder columns to put id first
-    cols = ['id'] + [col for col in all_athletes.columns if col != 'id']
-    all_athletes = all_athletes[cols]
+    # Combine all athlete records and assign unified athlete IDs (auto-increment starting from 1)
+    all_athletes = combine_athlete_records([
+        (matched_athletes, len(matched_athletes)),
+        (pwa_only_records, len(pwa_only_df)),
+        (lh_only_records, len(lh_only_df))
+    ])
 
     # Create link table
     link_table = create_link_table(all_athletes)
@@ -312,8 +322,8 @@ def main():
     final_file = f'{output_dir}/athletes_final.csv'
     link_file = f'{output_dir}/athlete_ids_link.csv'
 
-    all_athletes.to_csv(final_file, index=False)
-    link_table.to_csv(link_file, index=False)
+    write_dataframe_csv(all_athletes, final_file)
+    write_dataframe_csv(link_table, link_file)
 
     print(f"\n[OK] Final athletes saved: {final_file} ({len(all_athletes)} records)")
     print(f"[OK] Link table saved: {link_file} ({len(link_table)} records)")
@@ -324,8 +334,8 @@ def main():
     print("=" * 50)
     print(f"Total athletes: {len(all_athletes)}")
     print(f"  - Matched (both sources): {len(matched_athletes)}")
-    print(f"  - PWA-only: {len(pwa_only_records)}")
-    print(f"  - LiveHeats-only: {len(lh_only_records)}")
+    print(f"  - PWA-only: {len(pwa_only_df)}")
+    print(f"  - LiveHeats-only: {len(lh_only_df)}")
     print(f"\nLink table entries: {len(link_table)}")
 
     # Show sample
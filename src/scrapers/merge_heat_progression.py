@@ -99,9 +99,9 @@ class HeatProgressionMerger:
         ]
 
         # Add any missing columns
-        for col in required_cols:
-            if col not in df.columns:
-                df[col] = ''
+        missing = [col for col in required_cols if col not in df.columns]
+        if missing:
+            df[missing] = ''
 
         return df[required_cols]
 
@@ -133,9 +133,9 @@ class HeatProgressionMerger:
         ]
 
         # Add any missing columns
-        for col in required_cols:
-            if col not in df.columns:
-                df[col] = ''
+        missing = [col for col in required_cols if col not in df.columns]
+        if missing:
+            df[missing] = ''
 
         return df[required_cols]
 
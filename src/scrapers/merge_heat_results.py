@@ -99,9 +99,9 @@ class HeatResultsMerger:
         ]
 
         # Add any missing columns
-        for col in required_cols:
-            if col not in df.columns:
-                df[col] = ''
+        missing = [col for col in required_cols if col not in df.columns]
+        if missing:
+            df[missing] = ''
 
         return df[required_cols]
 
@@ -132,9 +132,9 @@ class HeatResultsMerger:
         ]
 
         # Add any missing columns
-        for col in required_cols:
-            if col not in df.columns:
-                df[col] = ''
+        missing = [col for col in required_cols if col not in df.columns]
+        if missing:
+            df[missing] = ''
 
         return df[required_cols]
 
@@ -1,12 +1,110 @@
 """
 Merge Heat Results Data from PWA and LiveHeats Sources
 Combines PWA heat scores and LiveHeats heat scores into unified dataset
-Output: Unified heat scores CSV
+Output: Unified heat scores Parquet file (CSV optional, with --csv)
 """
 
 import os
+import argparse
+import math
+import shutil
+import time
 import pandas as pd
+from pandas.api.types import union_categoricals
+import numpy as np
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Unified heat scores schema (PWA-only and LiveHeats-only fields are left empty
+# for the other source)
+HEAT_SCORE_COLUMNS = [
+    'source', 'scraped_at', 'pwa_event_id', 'pwa_year', 'pwa_event_name',
+    'pwa_division_code', 'sex', 'heat_id', 'athlete_id', 'athlete_name',
+    'sail_number', 'score', 'type', 'counting', 'modified_total', 'modifier',
+    'total_wave', 'total_jump', 'total_points', 'liveheats_event_id', 'liveheats_division_id'
+]
+
+# Dtypes of the standardized frames: text as Arrow-backed strings and IDs/year as
+# nullable integers, so missing values are NA rather than '' objects
+HEAT_SCORE_DTYPES = {
+    'source': 'string[pyarrow]', 'scraped_at': 'string[pyarrow]', 'pwa_event_id': 'Int32',
+    'pwa_year': 'Int32', 'pwa_event_name': 'string[pyarrow]', 'pwa_division_code': 'string[pyarrow]',
+    'sex': 'string[pyarrow]', 'athlete_name': 'string[pyarrow]', 'sail_number': 'string[pyarrow]',
+    'type': 'string[pyarrow]', 'modifier': 'string[pyarrow]',
+    'liveheats_event_id': 'Int64', 'liveheats_division_id': 'Int64'
+}
+
+# Low-cardinality columns stored as categoricals (categories are unioned across
+# chunks in merge_data)
+CATEGORY_COLUMNS = ['source', 'pwa_division_code', 'sex']
+
+# Sort order of the merged data: (column, descending)
+SORT_KEYS = [('pwa_year', True), ('pwa_event_id', False), ('heat_id', False), ('athlete_id', False)]
+
+# Rows per chunk when reading the source CSVs (bounds peak memory on large files)
+CHUNK_SIZE = 200_000
+
+# Columns read from each source CSV (before renaming), with explicit dtypes for
+# the text and score columns; ID columns keep their inferred types for sorting
+PWA_COLUMNS = [
+    'source', 'scraped_at', 'event_id', 'division_code', 'sex', 'heat_id', 'athlete_id',
+    'sailor_name', 'sail_number', 'score', 'type', 'counting', 'modified_total', 'modifier',
+    'total_wave', 'total_jump', 'total_points'
+]
+PWA_DTYPES = {
+    'source': 'string', 'scraped_at': 'string', 'division_code': 'string', 'sex': 'string',
+    'sailor_name': 'string', 'sail_number': 'string', 'type': 'string', 'counting': 'string',
+    'modifier': 'string', 'score': 'float64', 'modified_total': 'float64',
+    'total_wave': 'float64', 'total_jump': 'float64', 'total_points': 'float64'
+}
+
+LH_COLUMNS = [
+    'source', 'pwa_event_id', 'pwa_year', 'pwa_event_name', 'sex', 'heat_id', 'athlete_id',
+    'score', 'type', 'counting', 'modified_total', 'modifier', 'total_points',
+    'liveheats_event_id', 'liveheats_division_id'
+]
+LH_DTYPES = {
+    'source': 'string', 'pwa_event_name': 'string', 'sex': 'string', 'type': 'string',
+    'modifier': 'string', 'score': 'float64', 'modified_total': 'float64', 'total_points': 'float64'
+}
+
+
+def to_parquet_frame(df):
+    """
+    Give mixed-type object columns a single type so they can be written to Parquet
+
+    Columns whose non-empty values are all numbers become nullable numeric
+    columns ('' becomes null); any other mixed column is stored as text.
+
+    Args:
+        df: Merged heat scores DataFrame
+
+    Returns:
+        DataFrame with Arrow-compatible column types
+    """
+    df = df.copy()
+    for col in df.columns[df.dtypes == object]:
+        values = df[col].mask(df[col].eq(''))
+        if pd.api.types.infer_dtype(values, skipna=True) in ('integer', 'floating', 'mixed-integer-float'):
+            df[col] = values.convert_dtypes()
+        else:
+            df[col] = df[col].astype('string')
+    return df
+
+
+def to_int_array(values, dtype):
+    """
+    Coerce a column to a NumPy integer array, with missing or non-numeric values as 0
+
+    Args:
+        values: Series to coerce
+        dtype: Target integer dtype
+
+    Returns:
+        NumPy array of the given dtype
+    """
+    # to_numpy fills nulls and casts in one pass instead of fillna + astype
+    return pd.to_numeric(values, errors='coerce').to_numpy(dtype=dtype, na_value=0)
 
 
 class HeatScoresMerger:
@@ -32,36 +130,48 @@ class HeatScoresMerger:
 
     def log(self, message, level="INFO"):
         """Print timestamped log message"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = time.strftime("%H:%M:%S")
         print(f"[{timestamp}] [{level}] {message}")
 
-    def load_pwa_results(self):
-        """Load PWA heat scores data"""
+    def iter_pwa_chunks(self):
+        """Yield PWA heat scores data in chunks of CHUNK_SIZE rows"""
         self.log("Loading PWA heat scores...")
 
         if not os.path.exists(self.pwa_results_path):
             self.log(f"PWA results file not found: {self.pwa_results_path}", "WARNING")
-            return pd.DataFrame()
+            return
 
-        df = pd.read_csv(self.pwa_results_path)
-        self.stats['pwa_records'] = len(df)
-        self.log(f"Loaded {len(df)} PWA heat scores records")
+        reader = pd.read_csv(
+            self.pwa_results_path,
+            usecols=lambda c: c in PWA_COLUMNS,
+            dtype=PWA_DTYPES,
+            chunksize=CHUNK_SIZE
+        )
+        for chunk in reader:
+            self.stats['pwa_records'] += len(chunk)
+            yield chunk
 
-        return df
+        self.log(f"Loaded {self.stats['pwa_records']} PWA heat scores records")
 
-    def load_lh_results(self):
-        """Load LiveHeats heat scores data"""
+    def iter_lh_chunks(self):
+        """Yield LiveHeats heat scores data in chunks of CHUNK_SIZE rows"""
         self.log("Loading LiveHeats heat scores...")
 
         if not os.path.exists(self.lh_results_path):
             self.log(f"LiveHeats results file not found: {self.lh_results_path}", "WARNING")
-            return pd.DataFrame()
+            return
 
-        df = pd.read_csv(self.lh_results_path)
-        self.stats['liveheats_records'] = len(df)
-        self.log(f"Loaded {len(df)} LiveHeats heat scores records")
+        reader = pd.read_csv(
+            self.lh_results_path,
+            usecols=lambda c: c in LH_COLUMNS,
+            dtype=LH_DTYPES,
+            chunksize=CHUNK_SIZE
+        )
+        for chunk in reader:
+            self.stats['liveheats_records'] += len(chunk)
+            yield chunk
 
-        return df
+        self.log(f"Loaded {self.stats['liveheats_records']} LiveHeats heat scores records")
 
     def standardize_pwa_columns(self, df):
         """
@@ -75,15 +185,10 @@ class HeatScoresMerger:
         """
         self.log("Standardizing PWA columns...")
 
-        # Add missing columns for LiveHeats-specific fields
-        df['pwa_year'] = df['event_id'].astype(str).str[:4].astype(int)
-        df['pwa_event_name'] = ''
-        df['liveheats_event_id'] = ''
-        df['liveheats_division_id'] = ''
-
-        # Extract sex from data if not present
-        if 'sex' not in df.columns:
-            df['sex'] = ''
+        # Year from the leading four digits of the event ID, computed on the integers
+        event_ids = pd.to_numeric(df['event_id'], errors='coerce').fillna(0).astype('int64').to_numpy()
+        digits = np.floor(np.log10(np.maximum(event_ids, 1))).astype('int64') + 1
+        df['pwa_year'] = (event_ids // 10 ** np.maximum(digits - 4, 0)).astype('int32')
 
         # Rename columns to match unified schema
         df = df.rename(columns={
@@ -92,20 +197,11 @@ class HeatScoresMerger:
             'sailor_name': 'athlete_name'
         })
 
-        # Ensure required columns exist
-        required_cols = [
-            'source', 'scraped_at', 'pwa_event_id', 'pwa_year', 'pwa_event_name',
-            'pwa_division_code', 'sex', 'heat_id', 'athlete_id', 'athlete_name',
-            'sail_number', 'score', 'type', 'counting', 'modified_total', 'modifier',
-            'total_wave', 'total_jump', 'total_points', 'liveheats_event_id', 'liveheats_division_id'
-        ]
-
-        # Add any missing columns
-        for col in required_cols:
-            if col not in df.columns:
-                df[col] = ''
+        # Select the unified columns in one pass (missing ones become NA)
+        df = df.reindex(columns=HEAT_SCORE_COLUMNS).astype(HEAT_SCORE_DTYPES)
+        df[CATEGORY_COLUMNS] = df[CATEGORY_COLUMNS].astype('category')
 
-        return df[required_cols]
+        return df
 
     def standardize_lh_columns(self, df):
         """
@@ -119,44 +215,41 @@ class HeatScoresMerger:
         """
         self.log("Standardizing LiveHeats columns...")
 
-        # Add missing columns for PWA-specific fields
-        df['pwa_division_code'] = ''
-        df['athlete_name'] = ''
-        df['sail_number'] = ''
-        df['total_wave'] = ''
-        df['total_jump'] = ''
         df['scraped_at'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
-        # Ensure required columns exist
-        required_cols = [
-            'source', 'scraped_at', 'pwa_event_id', 'pwa_year', 'pwa_event_name',
-            'pwa_division_code', 'sex', 'heat_id', 'athlete_id', 'athlete_name',
-            'sail_number', 'score', 'type', 'counting', 'modified_total', 'modifier',
-            'total_wave', 'total_jump', 'total_points', 'liveheats_event_id', 'liveheats_division_id'
-        ]
-
-        # Add any missing columns
-        for col in required_cols:
-            if col not in df.columns:
-                df[col] = ''
+        # Select the unified columns in one pass (missing ones become NA)
+        df = df.reindex(columns=HEAT_SCORE_COLUMNS).astype(HEAT_SCORE_DTYPES)
+        df[CATEGORY_COLUMNS] = df[CATEGORY_COLUMNS].astype('category')
 
-        return df[required_cols]
+        return df
 
-    def merge_data(self, pwa_df, lh_df):
+    def merge_data(self, chunks):
         """
         Merge PWA and LiveHeats data
 
         Args:
-            pwa_df: Standardized PWA DataFrame
-            lh_df: Standardized LiveHeats DataFrame
+            chunks: Standardized PWA and LiveHeats DataFrame chunks
 
         Returns:
             Merged DataFrame
         """
         self.log("\nMerging heat scores data...")
 
-        # Since these are different events, just concatenate
-        merged_df = pd.concat([pwa_df, lh_df], ignore_index=True)
+        if len(chunks) == 1:
+            # Only one source had data, and it fit in a single chunk: nothing to join
+            merged_df = chunks[0].reset_index(drop=True)
+        else:
+            # Since these are different events, just concatenate (once, across all chunks).
+            # Every chunk has the same columns, so join them column by column rather than
+            # aligning blocks frame by frame (this keeps the nullable/Arrow column dtypes).
+            merged_df = pd.DataFrame({
+                col: (
+                    pd.Series(union_categoricals([chunk[col] for chunk in chunks]))
+                    if col in CATEGORY_COLUMNS
+                    else pd.concat([chunk[col] for chunk in chunks], ignore_index=True)
+                )
+                for col in HEAT_SCORE_COLUMNS
+            })
 
         self.stats['total_merged'] = len(merged_df)
 
@@ -177,17 +270,70 @@ class HeatScoresMerger:
         """
         self.log("Sorting results...")
 
-        # Convert to numeric for sorting
-        df['pwa_year'] = pd.to_numeric(df['pwa_year'], errors='coerce').fillna(0).astype(int)
-        df['pwa_event_id'] = pd.to_numeric(df['pwa_event_id'], errors='coerce').fillna(0).astype(int)
+        # Convert to compact integers for sorting
+        df['pwa_year'] = to_int_array(df['pwa_year'], 'int16')
+        df['pwa_event_id'] = to_int_array(df['pwa_event_id'], 'int32')
+
+        # Sort by: year (desc), event_id, heat_id, athlete_id. Each key is ranked
+        # with factorize (same ordering as sort_values, missing values last) and the
+        # ranks are packed into one int64 key, so a single stable argsort orders rows.
+        ranks, sizes = [], []
+        for col, descending in SORT_KEYS:
+            codes, uniques = pd.factorize(df[col], sort=True)
+            if descending:
+                codes = np.where(codes >= 0, len(uniques) - 1 - codes, codes)
+            ranks.append(np.where(codes < 0, len(uniques), codes))
+            sizes.append(len(uniques) + 1)
+
+        radix = math.prod(sizes)
+        if radix < 2 ** 63:
+            # Narrowest integer key that fits (16-bit keys get NumPy's radix sort)
+            key_dtype = next(t for t in (np.int16, np.int32, np.int64) if radix <= np.iinfo(t).max)
+            key = np.zeros(len(df), dtype=key_dtype)
+            for rank, size in zip(ranks, sizes):
+                key = key * key_dtype(size) + rank.astype(key_dtype)
+            order = np.argsort(key, kind='stable')
+        else:
+            # Too many distinct keys to pack into 64 bits
+            order = np.lexsort(ranks[::-1])
+
+        return df.take(order)
+
+    def load_source(self, source):
+        """
+        Load one source's heat scores chunk by chunk, standardizing each chunk as it is read
 
-        # Sort by: year (desc), event_id, heat_id, athlete_id
-        df = df.sort_values(
-            by=['pwa_year', 'pwa_event_id', 'heat_id', 'athlete_id'],
-            ascending=[False, True, True, True]
-        )
+        Chunks are standardized on a worker thread while the next chunk is
+        parsed. Runs in a worker process, so the record count is returned
+        rather than left in self.stats.
 
-        return df
+        Args:
+            source: 'pwa' or 'liveheats'
+
+        Returns:
+            Tuple of (standardized DataFrame chunks, records loaded)
+        """
+        if source == 'pwa':
+            reader, standardize, stat = self.iter_pwa_chunks(), self.standardize_pwa_columns, 'pwa_records'
+        else:
+            reader, standardize, stat = self.iter_lh_chunks(), self.standardize_lh_columns, 'liveheats_records'
+
+        # Keep one chunk in flight: submit chunk N+1, then collect chunk N, so
+        # unprocessed chunks never pile up in memory
+        chunks = []
+        pending = None
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            for chunk in reader:
+                if chunk.empty:
+                    continue
+                future = pool.submit(standardize, chunk)
+                if pending is not None:
+                    chunks.append(pending.result())
+                pending = future
+            if pending is not None:
+                chunks.append(pending.result())
+
+        return chunks, self.stats[stat]
 
     def run_merge(self):
         """Execute complete merge process"""
@@ -195,23 +341,18 @@ class HeatScoresMerger:
         self.log("HEAT SCORES MERGE - STARTING")
         self.log("="*80 + "\n")
 
-        # Step 1: Load data
-        pwa_df = self.load_pwa_results()
-        lh_df = self.load_lh_results()
+        # Steps 1-2: Load and standardize both sources in parallel worker processes
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            (pwa_chunks, self.stats['pwa_records']), (lh_chunks, self.stats['liveheats_records']) = pool.map(
+                self.load_source, ['pwa', 'liveheats']
+            )
 
-        if pwa_df.empty and lh_df.empty:
+        if not pwa_chunks and not lh_chunks:
             self.log("ERROR: No data to merge!", "ERROR")
             return None
 
-        # Step 2: Standardize columns
-        if not pwa_df.empty:
-            pwa_df = self.standardize_pwa_columns(pwa_df)
-
-        if not lh_df.empty:
-            lh_df = self.standardize_lh_columns(lh_df)
-
         # Step 3: Merge
-        merged_df = self.merge_data(pwa_df, lh_df)
+        merged_df = self.merge_data(pwa_chunks + lh_chunks)
 
         # Step 4: Sort
         merged_df = self.sort_results(merged_df)
@@ -221,18 +362,33 @@ class HeatScoresMerger:
         return merged_df
 
     def save_merged_data(self, output_path):
-        """Save merged data to CSV"""
+        """
+        Save merged data to Parquet (or to CSV / Arrow IPC for a .csv / .feather path)
+
+        Args:
+            output_path: Output file path
+
+        Returns:
+            Written path, or None if there was nothing to save
+        """
         if self.merged_data is None or self.merged_data.empty:
             self.log("No merged data to save!", "WARNING")
-            return
+            return None
 
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-        self.merged_data.to_csv(output_path, index=False, encoding='utf-8-sig')
+        if output_path.endswith('.csv'):
+            self.merged_data.to_csv(output_path, index=False, encoding='utf-8-sig')
+        elif output_path.endswith('.feather'):
+            to_parquet_frame(self.merged_data).reset_index(drop=True).to_feather(output_path, compression='zstd')
+        else:
+            to_parquet_frame(self.merged_data).to_parquet(output_path, engine='pyarrow', compression='zstd', index=False)
 
         self.log(f"\nMerged heat progression saved to: {output_path}")
         self.log(f"Total rows: {len(self.merged_data)}")
 
+        return output_path
+
     def print_summary(self):
         """Print merge statistics"""
         self.log("\n" + "="*80)
@@ -245,22 +401,36 @@ class HeatScoresMerger:
         self.log("="*80 + "\n")
 
         if self.merged_data is not None:
-            # Source breakdown
-            source_counts = self.merged_data['source'].value_counts()
+            # Source breakdown (most records first)
+            source_counts = (
+                self.merged_data.groupby('source', sort=False, observed=True).size()
+                .sort_values(ascending=False, kind='stable')
+            )
             self.log("Records by Source:")
             for source, count in source_counts.items():
                 self.log(f"  {source}: {count}")
 
-            # Year breakdown
-            year_counts = self.merged_data['pwa_year'].value_counts().sort_index(ascending=False)
+            # Year breakdown (newest first, unknown years skipped)
+            years = self.merged_data['pwa_year'].to_numpy()
+            years, year_counts = np.unique(years[years > 0], return_counts=True)
             self.log("\nRecords by Year:")
-            for year, count in year_counts.items():
-                if year > 0:
-                    self.log(f"  {int(year)}: {count}")
+            if len(years):
+                # One write for the whole breakdown rather than a log call per year
+                print('\n'.join(f"  {int(year)}: {count}" for year, count in zip(years[::-1], year_counts[::-1])))
 
 
 def main():
     """Main execution"""
+    parser = argparse.ArgumentParser(
+        description='Merge PWA and LiveHeats heat scores'
+    )
+    parser.add_argument(
+        '--csv',
+        action='store_true',
+        help='Also write heat_scores_merged.csv (for tools that still read the CSV)'
+    )
+    args = parser.parse_args()
+
     print("="*80)
     print("HEAT SCORES MERGER - PWA + LIVE HEATS")
     print("="*80)
@@ -276,8 +446,10 @@ def main():
 
     # Output path
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_path = os.path.join(project_root, 'data', 'processed', f'heat_scores_merged_{timestamp}.csv')
-    standard_output = os.path.join(project_root, 'data', 'processed', 'heat_scores_merged.csv')
+    output_path = os.path.join(project_root, 'data', 'processed', f'heat_scores_merged_{timestamp}.parquet')
+    standard_output = os.path.join(project_root, 'data', 'processed', 'heat_scores_merged.parquet')
+    feather_output = os.path.join(project_root, 'data', 'processed', 'heat_scores_merged.feather')
+    csv_output = os.path.join(project_root, 'data', 'processed', 'heat_scores_merged.csv')
 
     # Initialize merger
     merger = HeatScoresMerger(pwa_results, lh_results)
@@ -288,13 +460,41 @@ def main():
 
         if merged_df is not None:
             # Save results to timestamped file
-            merger.save_merged_data(output_path)
-
-            # Try to save to standard filename
+            saved_path = merger.save_merged_data(output_path)
+
+            # Point the standard filename at the same file (hard link, or a copy where
+            # links are not supported) instead of writing the CSV a second time
+            if saved_path:
+                try:
+                    if os.path.exists(standard_output):
+                        os.remove(standard_output)
+                    try:
+                        os.link(saved_path, standard_output)
+                    except OSError:
+                        shutil.copyfile(saved_path, standard_output)
+                    merger.log(f"Standard output: {standard_output}")
+                except PermissionError:
+                    merger.log(f"Could not overwrite {standard_output} (file may be open)", "WARNING")
+
+            # Arrow IPC copy for later pipeline stages
             try:
-                merger.save_merged_data(standard_output)
+                merger.save_merged_data(feather_output)
             except PermissionError:
-                merger.log(f"Could not overwrite {standard_output} (file may be open)", "WARNING")
+                merger.log(f"Could not overwrite {feather_output} (file may be open)", "WARNING")
+
+            # Optional CSV compatibility output; without --csv, remove any CSV left by
+            # an earlier run so nothing reads stale scores from it
+            if args.csv:
+                try:
+                    merger.save_merged_data(csv_output)
+                except PermissionError:
+                    merger.log(f"Could not overwrite {csv_output} (file may be open)", "WARNING")
+            elif os.path.exists(csv_output):
+                try:
+                    os.remove(csv_output)
+                    merger.log(f"Removed stale {csv_output} (pass --csv to keep writing it)")
+                except PermissionError:
+                    merger.log(f"Could not remove stale {csv_output} (file may be open)", "WARNING")
 
             # Print summary
             merger.print_summary()
@@ -7,6 +7,8 @@ athlete database project, we'll use that data and merge it with our database IDs
 
 import pandas as pd
 import os
+import shutil
+from csv_writer import write_dataframe_csv
 
 def main():
     print("Merging Old PWA Data with Current Database IDs")
@@ -27,34 +29,34 @@ def main():
     # Database athlete_id for PWA is the numeric ID, old data has pwa_sail_no
     # Let's try matching on sail number first
 
-    # Merge on sail number
-    merged = db_pwa.merge(
-        old_pwa,
-        left_on='sail_number',
-        right_on='pwa_sail_no',
-        how='left',
-        suffixes=('_db', '_old')
+    # Look up old PWA details by sail number (one old record per sail number)
+    old_by_sail = (
+        old_pwa.dropna(subset=['pwa_sail_no'])
+        .drop_duplicates('pwa_sail_no')
+        .set_index('pwa_sail_no')
     )
+    sail_numbers = db_pwa['sail_number']
+    old_names = sail_numbers.map(old_by_sail['pwa_name'])
 
-    print(f"\nMatched {merged['pwa_name'].notna().sum()}/{len(db_pwa)} athletes on sail number")
+    print(f"\nMatched {old_names.notna().sum()}/{len(db_pwa)} athletes on sail number")
 
     # For unmatched athletes, we'll use the athlete_name from database
-    unmatched_count = merged['pwa_name'].isna().sum()
+    unmatched_count = old_names.isna().sum()
     print(f"Using database names for {unmatched_count} unmatched athletes")
 
     # Create final dataset with consistent columns
     final = pd.DataFrame({
-        'athlete_id': merged['athlete_id'],
-        'name': merged['pwa_name'].fillna(merged['athlete_name']),
-        'age': merged['pwa_age'],
-        'year_of_birth': merged['pwa_yob'],
-        'nationality': merged['pwa_nationality'],
-        'sail_number': merged['pwa_sail_no'].fillna(merged['sail_number']),
-        'sponsors': merged['pwa_current_sponsors'],
-        'profile_url': merged['pwa_url'],
-        'first_seen_year': merged['first_seen_year'],
-        'last_seen_year': merged['last_seen_year'],
-        'event_count': merged['event_count']
+        'athlete_id': db_pwa['athlete_id'],
+        'name': old_names.fillna(db_pwa['athlete_name']),
+        'age': sail_numbers.map(old_by_sail['pwa_age']),
+        'year_of_birth': sail_numbers.map(old_by_sail['pwa_yob']),
+        'nationality': sail_numbers.map(old_by_sail['pwa_nationality']),
+        'sail_number': sail_numbers,
+        'sponsors': sail_numbers.map(old_by_sail['pwa_current_sponsors']),
+        'profile_url': sail_numbers.map(old_by_sail['pwa_url']),
+        'first_seen_year': db_pwa['first_seen_year'],
+        'last_seen_year': db_pwa['last_seen_year'],
+        'event_count': db_pwa['event_count']
     })
 
     # Remove athletes with no name (not found in old data)
@@ -69,8 +71,10 @@ def main():
     raw_output = f'{output_dir}/pwa_athletes_raw.csv'
     clean_output = f'{output_dir}/pwa_athletes_clean.csv'
 
-    final.to_csv(raw_output, index=False)
-    final.to_csv(clean_output, index=False)
+    # Serialize once; the clean file is a byte copy (not a hard link, since the
+    # profile scrapers rewrite pwa_athletes_raw.csv in place)
+    write_dataframe_csv(final, raw_output)
+    shutil.copyfile(raw_output, clean_output)
 
     print(f"\n[OK] Saved to: {raw_output}")
     print(f"[OK] Saved to: {clean_output}")
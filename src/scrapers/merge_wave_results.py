@@ -97,9 +97,10 @@ class WaveResultsMerger:
         ]
 
         # Add missing columns
-        for col in required_cols:
-            if col not in df.columns:
-                df[col] = ''
+        missing = [col for col in required_cols if col not in df.columns]
+        if missing:
+            df[missing] = ''
+            for col in missing:
                 self.log(f"Added missing column '{col}' to {source} results", "WARNING")
 
         # Ensure correct order
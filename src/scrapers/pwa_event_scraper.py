@@ -4,11 +4,25 @@ Scrapes event metadata from PWA World Tour website (2016-2025)
 Output: CSV with comprehensive event details
 """
 
+import os
 import time
 import csv
 import re
+import json
+import argparse
+import queue
+import random
+import functools
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import urllib3
+import lxml.html
+from lxml import etree
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
@@ -16,11 +30,202 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import WebDriverException, TimeoutException
 
+# Disable SSL warnings (PWA site has SSL issues)
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# Year dropdown links rarely change, so they are cached between runs
+CACHE_DIR = 'data/cache'
+YEAR_URLS_CACHE = f'{CACHE_DIR}/pwa_year_urls.json'
+YEAR_URLS_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# Optional persistent Chrome profiles (HTTP/DNS cache, cookies) reused across runs;
+# one per pool slot, as Chrome locks a profile while it is open. Only used when
+# PWA_CHROME_PROFILE_DIR is set (e.g. a cached directory in CI), since concurrent
+# runs cannot share a profile; otherwise each browser gets a throwaway profile.
+CHROME_PROFILE_DIR = os.environ.get('PWA_CHROME_PROFILE_DIR')
+
+# Year pages fetched at once over HTTP (browser fallbacks are limited by the driver pool)
+MAX_CONCURRENT_FETCHES = 20
+
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+
+# Output column order
+EVENT_COLUMNS = [
+    'source', 'scraped_at', 'year', 'event_id', 'event_name', 'event_url',
+    'event_date', 'start_date', 'end_date', 'day_window', 'event_section',
+    'event_status', 'competition_state', 'has_wave_discipline',
+    'all_disciplines', 'country_flag', 'country_code', 'stars', 'event_image_url'
+]
+
+# Patterns applied to every event card
+STARS_RE = re.compile(r'\*+')
+DISCIPLINE_RE = re.compile(r'icon-discipline-(\d+)')
+FLAG_RE = re.compile(r'/([A-Z]{2,3})\.png')
+STATUS_RE = re.compile(r'event-status-(\d+)')
+STATE_RE = re.compile(r'event-competition-state-(\d+)')
+EVENT_ID_RE = re.compile(r'(?:%5B|\[)showUid(?:%5D|\])=([^&]*)')
+
+# Reads the text and href of every link in the year dropdown (arguments[0])
+YEAR_LINKS_JS = """
+return Array.from(arguments[0].querySelectorAll('a'), function (link) {
+    return {text: link.textContent.trim(), href: link.href};
+});
+"""
+
+# Reads the title and every field of every event card of each section on a year
+# page in one browser round-trip, instead of WebDriver commands per section/field.
+# arguments[0] is an optional list of event ids: other cards are skipped before
+# their fields are read (cards without a numeric id are always kept).
+HARVEST_SECTIONS_JS = """
+var eventIds = arguments[0];
+var eventIdRe = /(?:%5B|\\[)showUid(?:%5D|\\])=([^&]*)/;
+function wanted(card) {
+    if (!eventIds) {
+        return true;
+    }
+    var link = card.querySelector('.event-calendar-link');
+    var match = link ? eventIdRe.exec(link.href) : null;
+    return !match || !/^\\d+$/.test(match[1]) || eventIds.indexOf(Number(match[1])) >= 0;
+}
+function harvestCard(card) {
+    var link = card.querySelector('.event-calendar-link');
+    var title = card.querySelector('.event-title');
+    var date = card.querySelector('.event-date');
+    var disciplines = card.querySelector('.event-disciplines');
+    var flag = card.querySelector('.event-country-flag img');
+    var image = card.querySelector('.event-image img');
+    return {
+        href: link ? link.href : null,
+        title: title ? title.textContent.trim() : '',
+        date: date ? date.textContent.trim() : '',
+        disciplines: disciplines
+            ? Array.from(disciplines.querySelectorAll('i'), function (icon) { return icon.className; })
+            : [],
+        flag_title: flag ? (flag.getAttribute('title') || flag.getAttribute('alt') || '') : '',
+        flag_src: flag ? flag.src : '',
+        image: image ? image.src : '',
+        classes: card.className
+    };
+}
+return Array.from(document.querySelectorAll('.event-calendar-grid'), function (section) {
+    var title = section.querySelector('h3');
+    return {
+        title: title ? title.textContent.trim() : null,
+        cards: Array.from(section.querySelectorAll('.event-calendar-item')).filter(wanted).map(harvestCard)
+    };
+});
+"""
+
+@functools.lru_cache(maxsize=None)
+def parse_date(date_str, year):
+    """
+    Parse a card date string (cached, as the same days recur across a season)
+
+    Args:
+        date_str: Date string like "Sep 27" or "Oct 06"
+        year: Year as string
+
+    Returns:
+        datetime, or None if parsing fails
+    """
+    try:
+        # Parse "Sep 27" format
+        return datetime.strptime(f"{date_str} {year}", "%b %d %Y")
+    except ValueError:
+        return None
+
+
+
+def has_class(name):
+    """XPath predicate matching elements whose class list contains name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Static-HTML equivalents of the selectors in HARVEST_SECTIONS_JS
+SECTIONS_XP = etree.XPath(f"//*[{has_class('event-calendar-grid')}]")
+SECTION_TITLE_XP = etree.XPath(".//h3")
+CARDS_XP = etree.XPath(f".//*[{has_class('event-calendar-item')}]")
+CARD_LINK_XP = etree.XPath(f".//*[{has_class('event-calendar-link')}]")
+CARD_TITLE_XP = etree.XPath(f".//*[{has_class('event-title')}]")
+CARD_DATE_XP = etree.XPath(f".//*[{has_class('event-date')}]")
+CARD_DISCIPLINES_XP = etree.XPath(f".//*[{has_class('event-disciplines')}]")
+ICONS_XP = etree.XPath(".//i")
+CARD_FLAG_XP = etree.XPath(f".//*[{has_class('event-country-flag')}]//img")
+CARD_IMAGE_XP = etree.XPath(f".//*[{has_class('event-image')}]//img")
+
+
+def first(elements):
+    """First element of an XPath result, or None"""
+    return elements[0] if elements else None
+
+
+def harvest_card_html(card):
+    """
+    Read the raw fields of one event card from static HTML (same dict as harvestCard in HARVEST_SECTIONS_JS)
+
+    Args:
+        card: lxml element of the event card (links already made absolute)
+
+    Returns:
+        Dict of raw card fields
+    """
+    link = first(CARD_LINK_XP(card))
+    title = first(CARD_TITLE_XP(card))
+    date = first(CARD_DATE_XP(card))
+    disciplines = first(CARD_DISCIPLINES_XP(card))
+    flag = first(CARD_FLAG_XP(card))
+    image = first(CARD_IMAGE_XP(card))
+    return {
+        'href': link.get('href', '') if link is not None else None,
+        'title': title.text_content().strip() if title is not None else '',
+        'date': date.text_content().strip() if date is not None else '',
+        'disciplines': [icon.get('class', '') for icon in ICONS_XP(disciplines)] if disciplines is not None else [],
+        'flag_title': (flag.get('title') or flag.get('alt') or '') if flag is not None else '',
+        'flag_src': flag.get('src', '') if flag is not None else '',
+        'image': image.get('src', '') if image is not None else '',
+        'classes': card.get('class', ''),
+    }
+
+
+def harvest_sections_html(html, base_url, wanted=None):
+    """
+    Read the event sections of a year page from static HTML (same result as HARVEST_SECTIONS_JS)
+
+    Args:
+        html: Page HTML (bytes or str)
+        base_url: Page URL, used to make href/src absolute as the browser does
+        wanted: Optional predicate on a card's link href; other cards are skipped
+            before their fields are read (default: None = keep all)
+
+    Returns:
+        List of dicts with 'title' and 'cards' keys
+    """
+    root = lxml.html.fromstring(html, base_url=base_url)
+    root.make_links_absolute(base_url)
+
+    sections = []
+    for section in SECTIONS_XP(root):
+        title = first(SECTION_TITLE_XP(section))
+        cards = []
+        for card in CARDS_XP(section):
+            link = first(CARD_LINK_XP(card))
+            if wanted is None or link is None or wanted(link.get('href', '')):
+                cards.append(harvest_card_html(card))
+        sections.append({
+            'title': title.text_content().strip() if title is not None else None,
+            'cards': cards,
+        })
+    return sections
+
 
 class PWAEventScraper:
     """Scraper for PWA World Tour events"""
 
-    def __init__(self, start_year=2016, headless=True, event_ids=None):
+    def __init__(self, start_year=2016, headless=True, event_ids=None, workers=3,
+                 refresh_year_cache=False):
         """
         Initialize the scraper
 
@@ -28,21 +233,40 @@ class PWAEventScraper:
             start_year: Earliest year to scrape (default: 2016)
             headless: Run browser in headless mode (default: True)
             event_ids: Optional list of event IDs to filter (default: None = scrape all)
+            workers: Number of browsers to run in parallel for year pages that need JavaScript (default: 3)
+            refresh_year_cache: Re-read the year dropdown even if the cached copy is fresh (default: False)
         """
         self.start_year = start_year
+        self.refresh_year_cache = refresh_year_cache
         self.event_ids_filter = set(map(int, event_ids)) if event_ids else None
         self.base_url = "https://www.pwaworldtour.com/index.php?id=2337"
-
-        # Set up Chrome WebDriver
-        chrome_options = Options()
-        chrome_options.add_argument("--start-maximized")
-        if headless:
-            chrome_options.add_argument("--headless")
-
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.wait = WebDriverWait(self.driver, 90)
-
-        self.events_data = []
+        self.headless = headless
+        self.workers = workers
+
+        # HTTP session for year pages (static HTML), shared by all worker threads
+        self.session = self._create_session()
+
+        # Chrome WebDrivers, started only when needed (year dropdown not cached, or a
+        # year page that needs JavaScript): up to `workers`, shared between threads.
+        # The first one started is self.driver.
+        self.driver = None
+        self.wait = None
+        self.drivers = []
+        self.driver_pool = queue.Queue()
+        self.driver_pool_lock = threading.Lock()
+
+        # Scraped events, column-oriented ({column: [values]}) to avoid a dict per event;
+        # pd.DataFrame(events_data) builds the frame directly
+        self.events_data = {column: [] for column in EVENT_COLUMNS}
+
+        # Summary statistics, updated as events are added
+        self.stats = {
+            'total_events': 0,
+            'wave_events': 0,
+            'years': set(),
+            'event_ids': set(),
+            'failed_years': []
+        }
         self.scraped_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     def log(self, message):
@@ -50,13 +274,130 @@ class PWAEventScraper:
         timestamp = datetime.now().strftime("%H:%M:%S")
         print(f"[{timestamp}] {message}")
 
+    def _create_session(self):
+        """Create requests session with retry logic and a keep-alive connection per fetch thread"""
+        session = requests.Session()
+        session.headers.update({'User-Agent': USER_AGENT})
+
+        # Retry strategy
+        retry_strategy = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["HEAD", "GET", "OPTIONS"]
+        )
+
+        adapter = HTTPAdapter(
+            pool_connections=MAX_CONCURRENT_FETCHES,
+            pool_maxsize=MAX_CONCURRENT_FETCHES,
+            max_retries=retry_strategy
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        return session
+
+    def _make_driver(self, slot=0):
+        """
+        Create a configured Chrome WebDriver
+
+        Args:
+            slot: Pool slot, selects the persistent profile directory when
+                PWA_CHROME_PROFILE_DIR is set (default: 0)
+        """
+        chrome_options = Options()
+        chrome_options.add_argument("--start-maximized")
+        if self.headless:
+            chrome_options.add_argument("--headless")
+
+        # Reuse the slot's profile and disk cache from earlier runs
+        if CHROME_PROFILE_DIR:
+            profile_dir = os.path.join(CHROME_PROFILE_DIR, str(slot))
+            chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+            chrome_options.add_argument("--profile-directory=Default")
+            chrome_options.add_argument(f"--disk-cache-dir={os.path.join(profile_dir, 'cache')}")
+
+        # Only the DOM is scraped (image URLs are read from src attributes),
+        # so skip downloading images, stylesheets and fonts
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2,
+            "profile.managed_default_content_settings.fonts": 2,
+        })
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+
+        return webdriver.Chrome(options=chrome_options)
+
+    def start_driver(self):
+        """Start a browser (the first one started becomes self.driver)"""
+        driver = self._make_driver(slot=len(self.drivers))
+        self.drivers.append(driver)
+        if self.driver is None:
+            self.driver = driver
+            self.wait = WebDriverWait(driver, 90)
+        return driver
+
+    @contextmanager
+    def borrow_driver(self):
+        """Borrow a browser from the pool, starting another if all are busy and the pool is not full"""
+        driver = None
+        with self.driver_pool_lock:
+            try:
+                driver = self.driver_pool.get_nowait()
+            except queue.Empty:
+                if len(self.drivers) < self.workers:
+                    driver = self.start_driver()
+        if driver is None:
+            driver = self.driver_pool.get()
+
+        try:
+            yield driver
+        finally:
+            self.driver_pool.put(driver)
+
     def get_year_urls(self):
         """
-        Extract all year URLs from the dropdown menu
+        Get the URLs of all years from start_year, using the cached dropdown if it is fresh
 
         Returns:
             List of dicts with 'year' and 'id' keys
         """
+        all_years = None
+        if (not self.refresh_year_cache and os.path.exists(YEAR_URLS_CACHE)
+                and os.path.getmtime(YEAR_URLS_CACHE) > time.time() - YEAR_URLS_CACHE_TTL):
+            with open(YEAR_URLS_CACHE, encoding='utf-8') as f:
+                all_years = json.load(f)
+            self.log(f"Loaded {len(all_years)} years from cache: {YEAR_URLS_CACHE}")
+
+        if all_years is None:
+            all_years = self.read_year_dropdown()
+            if all_years:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                with open(YEAR_URLS_CACHE, 'w', encoding='utf-8') as f:
+                    json.dump(all_years, f)
+
+        # Only scrape years >= start_year
+        year_data = [year_info for year_info in all_years if int(year_info['year']) >= self.start_year]
+
+        self.log(f"Found {len(year_data)} years to scrape (from {self.start_year})")
+        return year_data
+
+    def read_year_dropdown(self):
+        """
+        Extract all year URLs from the dropdown menu
+
+        Returns:
+            List of dicts with 'year' and 'id' keys (empty if the dropdown could not be read)
+        """
+        # The dropdown needs JavaScript; this runs before any year is scraped,
+        # so the first browser can be started here and then handed to the pool
+        if self.driver is None:
+            self.driver_pool.put(self.start_driver())
+
         self.log("Navigating to PWA events page...")
         self.driver.get(self.base_url)
 
@@ -65,8 +406,11 @@ class PWAEventScraper:
             self.wait.until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, ".nav-sub.select-box .label"))
             )
-            self.log("Dropdown element found, waiting for page to stabilize...")
-            time.sleep(2)  # Additional wait for page stability
+            self.log("Dropdown element found, waiting for year links...")
+            # Page is ready once the dropdown's year links are in the DOM
+            self.wait.until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, ".nav-sub.select-box ul a"))
+            )
         except Exception as e:
             self.log(f"ERROR: Dropdown element not found after {self.wait._timeout}s: {e}")
             return []
@@ -89,33 +433,30 @@ class PWAEventScraper:
             return []
 
         self.log("Dropdown clicked successfully")
-        time.sleep(3)  # Wait for options to load
 
-        # Wait for dropdown options to be visible
+        # Wait for dropdown options (and their year links) to be visible
         dropdown_options = self.wait.until(
             EC.visibility_of_element_located((By.CSS_SELECTOR, ".nav-sub.select-box ul"))
         )
+        self.wait.until(
+            EC.visibility_of_element_located((By.CSS_SELECTOR, ".nav-sub.select-box ul a"))
+        )
 
-        # Find all year links
-        year_elements = dropdown_options.find_elements(By.TAG_NAME, "a")
+        # Read the text and href of every year link in one script call
+        year_links = self.driver.execute_script(YEAR_LINKS_JS, dropdown_options)
 
         year_data = []
-        for year_element in year_elements:
-            year_text = year_element.text.strip()
+        for year_link in year_links:
+            year_text = year_link['text']
             try:
-                year_int = int(year_text)
+                int(year_text)
             except ValueError:
                 continue  # Skip if conversion fails
 
-            # Only add years >= start_year
-            if year_int < self.start_year:
-                continue
-
-            href = year_element.get_attribute("href")
+            href = year_link['href']
             year_id = href.split("id=")[-1]
             year_data.append({"year": year_text, "id": year_id})
 
-        self.log(f"Found {len(year_data)} years to scrape (from {self.start_year})")
         return year_data
 
     def extract_star_rating(self, event_name):
@@ -128,242 +469,196 @@ class PWAEventScraper:
         Returns:
             Number of stars (int) or None if not found
         """
-        # Count asterisks in the event name
-        asterisks = re.findall(r'\*+', event_name)
+        # Count asterisks in the first run of asterisks in the event name
+        asterisks = STARS_RE.search(event_name)
         if asterisks:
-            return len(asterisks[0])
+            return len(asterisks.group())
         return None
 
-    def parse_date(self, date_str, year):
+    def wants_event(self, event_href):
         """
-        Parse date string to YYYY-MM-DD format
+        Check an event link against the event_ids filter
 
         Args:
-            date_str: Date string like "Sep 27" or "Oct 06"
-            year: Year as string
+            event_href: Event link URL
 
         Returns:
-            Date in YYYY-MM-DD format or None if parsing fails
+            True if there is no filter, the event is in it, or its id isn't a number
         """
-        try:
-            # Parse "Sep 27" format
-            date_obj = datetime.strptime(f"{date_str} {year}", "%b %d %Y")
-            return date_obj.strftime("%Y-%m-%d")
-        except ValueError:
-            return None
+        if not self.event_ids_filter:
+            return True
+
+        match = EVENT_ID_RE.search(event_href)
+        if not match or not match.group(1).isdigit():
+            return True
+        return int(match.group(1)) in self.event_ids_filter
 
     def extract_event_data(self, event_card, year, section_title):
         """
-        Extract all data from a single event card
+        Build the event data dict for a single event card
 
         Args:
-            event_card: Selenium WebElement for the event card
+            event_card: Dict of raw card fields returned by HARVEST_SECTIONS_JS
             year: Year string
             section_title: "Upcoming events" or "Completed events"
 
         Returns:
-            Dict with event data
+            Dict with event data, or None if the card is skipped
         """
-        try:
-            # Get the event link element
-            event_link = event_card.find_element(By.CLASS_NAME, "event-calendar-link")
-            event_href = event_link.get_attribute("href")
+        event_href = event_card['href']
+        if not event_href:
+            self.log("ERROR extracting event data: event card has no event-calendar-link")
+            return None
 
-            # Extract event_id from href
-            try:
-                event_id = event_href.split('%5BshowUid%5D=')[-1].split('&')[0]
-            except IndexError:
-                self.log(f"WARNING: Could not extract event_id from href: {event_href}")
-                event_id = None
-
-            # If event_ids filter is set, skip events not in the filter
-            if self.event_ids_filter and event_id:
-                try:
-                    if int(event_id) not in self.event_ids_filter:
-                        return None  # Skip this event
-                except (ValueError, TypeError):
-                    pass  # Continue if event_id can't be converted to int
-
-            # Extract event title
-            try:
-                # Use JavaScript to get text content directly (more reliable than .text for slow loading)
-                event_title_js = """
-                var titleElement = arguments[0].querySelector('.event-title');
-                return titleElement ? titleElement.textContent.trim() : '';
-                """
-                event_title = self.driver.execute_script(event_title_js, event_card)
-
-                # Debug: Log if title is empty
-                if not event_title:
-                    self.log(f"  WARNING: event_title is empty for event_id {event_id} (textContent is empty)")
-            except Exception as e:
-                # Log why event title extraction failed
-                self.log(f"  WARNING: Could not extract event_title for event_id {event_id}: {type(e).__name__}")
-                event_title = ""
+        # Extract event_id from href (tx_pwaevents_pi1[showUid] query parameter)
+        match = EVENT_ID_RE.search(event_href)
+        if match:
+            event_id = match.group(1)
+        else:
+            self.log(f"WARNING: Could not extract event_id from href: {event_href}")
+            event_id = None
+
+        # If event_ids filter is set, skip events not in the filter
+        if not self.wants_event(event_href):
+            return None  # Skip this event
+
+        # Event title (textContent, more reliable than .text for slow loading)
+        event_title = event_card['title']
+        if not event_title:
+            self.log(f"  WARNING: event_title is empty for event_id {event_id} (textContent is empty)")
+
+        # Event date
+        event_date = event_card['date']
+
+        # Parse start and end dates
+        start_date = None
+        end_date = None
+        day_window = None
+        if event_date and " - " in event_date:
+            date_parts = event_date.split(" - ")
+            start_dt = parse_date(date_parts[0], year)
+            end_dt = parse_date(date_parts[1], year)
+            if start_dt:
+                start_date = start_dt.strftime("%Y-%m-%d")
+            if end_dt:
+                end_date = end_dt.strftime("%Y-%m-%d")
+
+            # Calculate day window
+            if start_dt and end_dt:
+                day_window = (end_dt - start_dt).days
+
+        # Discipline icons
+        disciplines = []
+        has_wave = False
+        for icon_class in event_card['disciplines']:
+            # Extract number from "icon-discipline-1"
+            match = DISCIPLINE_RE.search(icon_class)
+            if match:
+                discipline_num = match.group(1)
+                disciplines.append(discipline_num)
+                if discipline_num == "1":  # Wave discipline
+                    has_wave = True
+
+        # Country flag
+        country_flag = event_card['flag_title']
+        country_code = ""
+
+        # Extract country code from filename (e.g., "GER.png" -> "GER")
+        match = FLAG_RE.search(event_card['flag_src'])
+        if match:
+            country_code = match.group(1)
+
+        # Event image URL
+        event_image_url = event_card['image']
+
+        # Extract event status and competition state from classes
+        event_status = ""
+        competition_state = ""
+        card_classes = event_card['classes']
+        status_match = STATUS_RE.search(card_classes)
+        if status_match:
+            event_status = status_match.group(1)
+
+        state_match = STATE_RE.search(card_classes)
+        if state_match:
+            competition_state = state_match.group(1)
+
+        # Extract star rating
+        stars = self.extract_star_rating(event_title)
+
+        # Build event data dict
+        event_data = {
+            'source': 'PWA',
+            'scraped_at': self.scraped_at,
+            'year': year,
+            'event_id': event_id,
+            'event_name': event_title,
+            'event_url': event_href,
+            'event_date': event_date,
+            'start_date': start_date,
+            'end_date': end_date,
+            'day_window': day_window,
+            'event_section': section_title,
+            'event_status': event_status,
+            'competition_state': competition_state,
+            'has_wave_discipline': has_wave,
+            'all_disciplines': ','.join(disciplines) if disciplines else '',
+            'country_flag': country_flag,
+            'country_code': country_code,
+            'stars': stars,
+            'event_image_url': event_image_url
+        }
 
-            # Extract event date
-            try:
-                # Use JavaScript to get text content directly (more reliable than .text for slow loading)
-                event_date_js = """
-                var dateElement = arguments[0].querySelector('.event-date');
-                return dateElement ? dateElement.textContent.trim() : '';
-                """
-                event_date = self.driver.execute_script(event_date_js, event_card)
-            except:
-                event_date = ""
-
-            # Parse start and end dates
-            start_date = None
-            end_date = None
-            day_window = None
-            if event_date and " - " in event_date:
-                date_parts = event_date.split(" - ")
-                start_date = self.parse_date(date_parts[0], year)
-                end_date = self.parse_date(date_parts[1], year)
-
-                # Calculate day window
-                if start_date and end_date:
-                    try:
-                        start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-                        end_dt = datetime.strptime(end_date, "%Y-%m-%d")
-                        day_window = (end_dt - start_dt).days
-                    except:
-                        pass
-
-            # Extract discipline icons
-            disciplines = []
-            has_wave = False
-            try:
-                discipline_container = event_card.find_element(By.CLASS_NAME, "event-disciplines")
-                discipline_icons = discipline_container.find_elements(By.TAG_NAME, "i")
-                for icon in discipline_icons:
-                    icon_class = icon.get_attribute("class")
-                    # Extract number from "icon-discipline-1"
-                    match = re.search(r'icon-discipline-(\d+)', icon_class)
-                    if match:
-                        discipline_num = match.group(1)
-                        disciplines.append(discipline_num)
-                        if discipline_num == "1":  # Wave discipline
-                            has_wave = True
-            except:
-                pass
-
-            # Extract country flag
-            country_flag = ""
-            country_code = ""
-            try:
-                flag_img = event_card.find_element(By.CSS_SELECTOR, ".event-country-flag img")
-                country_flag = flag_img.get_attribute("title") or flag_img.get_attribute("alt") or ""
-
-                # Extract country code from filename (e.g., "GER.png" -> "GER")
-                flag_src = flag_img.get_attribute("src")
-                match = re.search(r'/([A-Z]{2,3})\.png', flag_src)
-                if match:
-                    country_code = match.group(1)
-            except:
-                pass
-
-            # Extract event image URL
-            event_image_url = ""
-            try:
-                image = event_card.find_element(By.CSS_SELECTOR, ".event-image img")
-                event_image_url = image.get_attribute("src")
-            except:
-                pass
-
-            # Extract event status and competition state from classes
-            event_status = ""
-            competition_state = ""
-            try:
-                card_classes = event_card.get_attribute("class")
-                status_match = re.search(r'event-status-(\d+)', card_classes)
-                if status_match:
-                    event_status = status_match.group(1)
-
-                state_match = re.search(r'event-competition-state-(\d+)', card_classes)
-                if state_match:
-                    competition_state = state_match.group(1)
-            except:
-                pass
-
-            # Extract star rating
-            stars = self.extract_star_rating(event_title)
-
-            # Build event data dict
-            event_data = {
-                'source': 'PWA',
-                'scraped_at': self.scraped_at,
-                'year': year,
-                'event_id': event_id,
-                'event_name': event_title,
-                'event_url': event_href,
-                'event_date': event_date,
-                'start_date': start_date,
-                'end_date': end_date,
-                'day_window': day_window,
-                'event_section': section_title,
-                'event_status': event_status,
-                'competition_state': competition_state,
-                'has_wave_discipline': has_wave,
-                'all_disciplines': ','.join(disciplines) if disciplines else '',
-                'country_flag': country_flag,
-                'country_code': country_code,
-                'stars': stars,
-                'event_image_url': event_image_url
-            }
-
-            return event_data
+        return event_data
 
-        except Exception as e:
-            self.log(f"ERROR extracting event data: {e}")
-            return None
+    def fetch_year_sections(self, year_url):
+        """
+        Fetch a year page over plain HTTP and read its event sections from the static HTML
 
-    def scrape_year(self, year, year_id):
+        Args:
+            year_url: URL of the year page
+
+        Returns:
+            List of section dicts (as returned by HARVEST_SECTIONS_JS), empty if none were found
         """
-        Scrape all events for a given year
+        try:
+            response = self.session.get(year_url, timeout=30, verify=False)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            self.log(f"  HTTP fetch failed: {e}")
+            return []
+
+        # With an event_ids filter, only matching cards are read
+        wanted = self.wants_event if self.event_ids_filter else None
+        return harvest_sections_html(response.content, year_url, wanted)
+
+    def load_year_sections(self, year, year_url, driver):
+        """
+        Load a year page in the browser and read its event sections
 
         Args:
             year: Year string
-            year_id: URL ID for the year
+            year_url: URL of the year page
+            driver: WebDriver to load the page with
+
+        Returns:
+            List of section dicts, or None if the page could not be loaded
         """
-        year_url = f"https://www.pwaworldtour.com/index.php?id={year_id}"
-        self.log(f"Scraping year {year}...")
+        wait = WebDriverWait(driver, 90)
 
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                self.driver.get(year_url)
+                driver.get(year_url)
 
-                # Wait for event sections to be visible
-                sections = self.wait.until(
+                # Wait for event sections to be present
+                wait.until(
                     EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".event-calendar-grid"))
                 )
 
-                events_found = 0
-
-                # Process each section (Upcoming/Completed)
-                for section in sections:
-                    try:
-                        # Get section title
-                        section_title = section.find_element(By.TAG_NAME, "h3").text.strip()
-
-                        # Find all event cards in this section
-                        event_cards = section.find_elements(By.CLASS_NAME, "event-calendar-item")
-
-                        self.log(f"  {section_title}: Found {len(event_cards)} events")
-
-                        for event_card in event_cards:
-                            event_data = self.extract_event_data(event_card, year, section_title)
-                            if event_data:
-                                self.events_data.append(event_data)
-                                events_found += 1
-
-                    except Exception as e:
-                        self.log(f"  ERROR processing section: {e}")
-                        continue
-
-                self.log(f"  Total events extracted for {year}: {events_found}")
-                break  # Success, exit retry loop
+                # Read all sections and their (wanted) event cards with one script call
+                event_ids = sorted(self.event_ids_filter) if self.event_ids_filter else None
+                return driver.execute_script(HARVEST_SECTIONS_JS, event_ids)
 
             except TimeoutException:
                 if attempt < max_retries - 1:
@@ -376,8 +671,53 @@ class PWAEventScraper:
                 self.log(f"  ERROR scraping year {year}: {e}")
                 break
 
+        return None
+
+    def scrape_year(self, year, year_id):
+        """
+        Scrape all events for a given year
+
+        Args:
+            year: Year string
+            year_id: URL ID for the year
+
+        Returns:
+            List of event data dicts
+        """
+        year_url = f"https://www.pwaworldtour.com/index.php?id={year_id}"
+        self.log(f"Scraping year {year}...")
+
+        # Year pages are server-rendered, so a plain HTTP fetch is usually enough.
+        # Fall back to a browser if the static HTML has no event sections.
+        sections = self.fetch_year_sections(year_url)
+        if not sections:
+            self.log("  No event sections in static HTML, loading page in browser...")
+            with self.borrow_driver() as driver:
+                sections = self.load_year_sections(year, year_url, driver)
+            if sections is None:
+                return []
+
+        events = []
+
+        # Process each section (Upcoming/Completed)
+        for section in sections:
+            section_title = section['title']
+            if section_title is None:
+                self.log("  ERROR processing section: no section title (h3) found")
+                continue
+
+            self.log(f"  {section_title}: Found {len(section['cards'])} events")
+
+            for event_card in section['cards']:
+                event_data = self.extract_event_data(event_card, year, section_title)
+                if event_data:
+                    events.append(event_data)
+
+        self.log(f"  Total events extracted for {year}: {len(events)}")
+        return events
+
     def scrape_all_years(self):
-        """Scrape events from all years"""
+        """Scrape events from all years, several years at a time"""
         year_urls = self.get_year_urls()
 
         if not year_urls:
@@ -385,14 +725,38 @@ class PWAEventScraper:
             return
 
         total_years = len(year_urls)
+        workers = min(MAX_CONCURRENT_FETCHES, total_years)
 
-        for idx, year_info in enumerate(year_urls, 1):
+        def scrape(indexed_year):
+            idx, year_info = indexed_year
+            time.sleep(random.uniform(0.1, 0.5))  # Stagger requests to be nice to the server
             self.log(f"\n--- Processing year {idx}/{total_years} ---")
-            self.scrape_year(year_info['year'], year_info['id'])
-            time.sleep(2)  # Be nice to the server
+            # A failed year (browser start-up, page parsing) must not discard the others
+            try:
+                return self.scrape_year(year_info['year'], year_info['id'])
+            except Exception as e:
+                self.log(f"ERROR scraping year {year_info['year']}: {e}")
+                self.stats['failed_years'].append(year_info['year'])
+                return []
+
+        # Page loads are network-bound, so threads overlap them; years that need a
+        # browser wait for one from the driver pool (at most self.workers browsers).
+        # map() yields in submission order, so events stay grouped by year.
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for events in pool.map(scrape, enumerate(year_urls, 1)):
+                for event in events:
+                    for column, values in self.events_data.items():
+                        values.append(event[column])
+                    self.stats['total_events'] += 1
+                    self.stats['wave_events'] += event['has_wave_discipline']
+                    self.stats['years'].add(event['year'])
+                    if event['event_id'] is not None:
+                        self.stats['event_ids'].add(event['event_id'])
 
         self.log(f"\n=== Scraping Complete ===")
-        self.log(f"Total events scraped: {len(self.events_data)}")
+        self.log(f"Total events scraped: {self.stats['total_events']}")
+        if self.stats['failed_years']:
+            self.log(f"Years that failed: {', '.join(map(str, sorted(self.stats['failed_years'])))}")
 
     def save_to_csv(self, output_path):
         """
@@ -401,42 +765,45 @@ class PWAEventScraper:
         Args:
             output_path: Path to output CSV file
         """
-        if not self.events_data:
+        columns = self.events_data
+        if not columns['event_id']:
             self.log("WARNING: No data to save")
             return
 
-        df = pd.DataFrame(self.events_data)
-
-        # Ensure columns are in the desired order
-        column_order = [
-            'source', 'scraped_at', 'year', 'event_id', 'event_name', 'event_url',
-            'event_date', 'start_date', 'end_date', 'day_window', 'event_section',
-            'event_status', 'competition_state', 'has_wave_discipline',
-            'all_disciplines', 'country_flag', 'country_code', 'stars', 'event_image_url'
-        ]
-
-        df = df[column_order]
-
-        df.to_csv(output_path, index=False, encoding='utf-8-sig')
+        # Write rows straight from the column lists (in EVENT_COLUMNS order)
+        with open(output_path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.writer(f)
+            writer.writerow(EVENT_COLUMNS)
+            writer.writerows(zip(*(columns[column] for column in EVENT_COLUMNS)))
         self.log(f"Data saved to: {output_path}")
 
         # Print summary statistics
         self.log("\n=== Summary Statistics ===")
-        self.log(f"Total events: {len(df)}")
-        self.log(f"Wave events: {df['has_wave_discipline'].sum()}")
-        self.log(f"Years covered: {df['year'].nunique()}")
-        self.log(f"Unique event IDs: {df['event_id'].nunique()}")
+        self.log(f"Total events: {self.stats['total_events']}")
+        self.log(f"Wave events: {self.stats['wave_events']}")
+        self.log(f"Years covered: {len(self.stats['years'])}")
+        self.log(f"Unique event IDs: {len(self.stats['event_ids'])}")
 
     def close(self):
-        """Close the browser"""
-        self.driver.quit()
-        self.log("Browser closed")
+        """Close the browsers"""
+        for driver in self.drivers:
+            driver.quit()
+        if self.drivers:
+            self.log("Browser closed")
 
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description='Scrape PWA World Tour event metadata')
+    parser.add_argument(
+        '--refresh-year-cache',
+        action='store_true',
+        help=f'Ignore the cached year dropdown ({YEAR_URLS_CACHE}) and read it from the site'
+    )
+    args = parser.parse_args()
+
     # Initialize scraper
-    scraper = PWAEventScraper(start_year=2016, headless=True)
+    scraper = PWAEventScraper(start_year=2016, headless=True, refresh_year_cache=args.refresh_year_cache)
 
     try:
         # Scrape all events
@@ -15,20 +15,67 @@ Output:
   - pwa_division_results_tracking.csv (updated with heat data flags)
 """
 
+import csv
+import json
+import os
 import time
 import re
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import pandas as pd
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-import xml.etree.ElementTree as ET
-import unicodedata
+import lxml.html
+from lxml import etree
 import urllib3
 
 # Disable SSL warnings (PWA site has SSL issues)
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Ladders page: elimination ladder links and the "no ladders" notice
+LADDER_RE = re.compile(r'%5Bladder%5D=([^&]*)')
+LADDER_LINKS_XP = etree.XPath('//a[contains(@href, "%5Bladder%5D=")]')
+NO_LADDERS_XP = etree.XPath('//*[contains(concat(" ", normalize-space(@class), " "), " no-entries-found-msg ")]')
+
+# Live ladder XML traversal paths, compiled once
+IS_WAVE_XP = etree.XPath("discipline = 'wave'")
+ROUNDS_XP = etree.XPath('rounds/round')
+HEATS_XP = etree.XPath('heats/heatGroup/heat')
+SAILORS_XP = etree.XPath('sailors/sailor')
+
+# Map ladder sex values onto the division names used elsewhere
+SEX_MAP = {'male': 'Men', 'female': 'Women'}
+
+# Output row layouts (column order of the CSV files). Rows are stored as
+# named tuples: far smaller than per-row dicts, and pd.DataFrame() still
+# picks the column names up from the fields
+HeatStructureRow = namedtuple('HeatStructureRow', [
+    'source', 'scraped_at', 'event_id', 'category_code', 'ladder_id', 'e_discipline_id',
+    'sex', 'elimination_name', 'round_name', 'round_order', 'heat_id', 'heat_order',
+    'total_winners_progressing', 'winners_progressing_to_round_order',
+    'total_losers_progressing', 'losers_progressing_to_round_order'
+])
+HeatResultRow = namedtuple('HeatResultRow', [
+    'source', 'scraped_at', 'event_id', 'category_code', 'ladder_id', 'e_discipline_id',
+    'heat_id', 'athlete_id', 'sailor_name', 'sail_number', 'place',
+    'result_total', 'win_by', 'needs'
+])
+HeatScoreRow = namedtuple('HeatScoreRow', [
+    'heat_id', 'heat_no', 'wave_count', 'jumps_count', 'wave_factor', 'jump_factor',
+    'source', 'scraped_at', 'event_id', 'category_code', 'athlete_id', 'sailor_name',
+    'sail_number', 'total_wave', 'total_jump', 'total_points', 'position',
+    'type', 'score', 'counting', 'modified_total', 'modifier'
+])
+
+# Maximum number of heat score JSON files downloaded at once
+MAX_CONCURRENT_FETCHES = 8
+
+# Maximum number of events scraped at once
+MAX_CONCURRENT_EVENTS = 4
+
 
 class PWAHeatScraper:
     """Scraper for PWA wave event heat data (structure, results, scores)"""
@@ -46,6 +93,9 @@ class PWAHeatScraper:
         self.heat_structure_data = []
         self.heat_results_data = []
         self.heat_scores_data = []
+        self.output_paths = None  # Set by stream_results_to()
+        self.output_files = {}
+        self.category_codes_cache = {}  # event_id -> category codes from the ladders page
         self.scraped_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         # Create session with retry logic
@@ -62,6 +112,7 @@ class PWAHeatScraper:
             'total_heat_scores': 0,
             'errors': 0
         }
+        self.stats_lock = threading.Lock()
 
     def _create_session(self):
         """Create requests session with retry logic"""
@@ -75,9 +126,17 @@ class PWAHeatScraper:
             allowed_methods=["HEAD", "GET", "OPTIONS"]
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # One pooled keep-alive connection per concurrent download (events x heats)
+        pool_size = MAX_CONCURRENT_EVENTS * MAX_CONCURRENT_FETCHES
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=pool_size,
+                              pool_maxsize=pool_size, pool_block=False)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
+        session.headers.update({
+            'Connection': 'keep-alive',
+            'User-Agent': 'PWAHeatScraper/1.0',
+            'Accept-Encoding': 'gzip, deflate'
+        })
 
         return session
 
@@ -94,14 +153,18 @@ class PWAHeatScraper:
             DataFrame of divisions to scrape for heat data
         """
         self.log("Loading PWA division tracking data...")
-        df = pd.read_csv(self.tracking_csv_path)
+        # Only the columns used to pick events; nullable dtypes tolerate blank cells
+        df = pd.read_csv(
+            self.tracking_csv_path,
+            usecols=['year', 'event_id', 'event_name', 'has_results'],
+            dtype={'year': 'Int16', 'event_id': 'Int32', 'event_name': 'string', 'has_results': 'boolean'}
+        )
 
         # Filter for divisions with results (2016+, has_results=True)
         # Excluding 2020-2021 (COVID years with no published results)
         divisions_with_results = df[
             (df['year'] >= 2016) &
-            (df['year'] != 2020) &
-            (df['year'] != 2021) &
+            ~df['year'].isin((2020, 2021)) &
             (df['has_results'] == True)
         ].copy()
 
@@ -125,53 +188,110 @@ class PWAHeatScraper:
         Returns:
             List of dicts with category_code and elimination_name
         """
+        # Ladders pages already parsed this run (duplicate tracking rows, re-runs of an event)
+        if event_id in self.category_codes_cache:
+            return self.category_codes_cache[event_id]
+
         url = f'https://www.pwaworldtour.com/index.php?id=1900&type=21&tx_pwaevent_pi1%5Baction%5D=ladders&tx_pwaevent_pi1%5BshowUid%5D={event_id}'
 
         try:
-            from bs4 import BeautifulSoup
-
             response = self.session.get(url, timeout=30, verify=False)
 
             if response.status_code != 200:
                 self.log(f"Failed to fetch ladders page for event {event_id}: HTTP {response.status_code}", "WARNING")
                 return []
 
-            soup = BeautifulSoup(response.content, 'lxml')
+            tree = lxml.html.fromstring(response.content)
 
             # Check for "no elimination ladders" message
-            no_ladders = soup.find_all(class_='no-entries-found-msg')
-            if no_ladders:
+            if NO_LADDERS_XP(tree):
                 self.log(f"No elimination ladders found for event {event_id}", "INFO")
+                self.category_codes_cache[event_id] = []
                 return []
 
-            # Find all ladder links
-            ladder_links = soup.find_all('a', href=True)
-
             category_codes = []
-            for link in ladder_links:
-                href = link.get('href', '')
-                if '%5Bladder%5D=' in href:
-                    try:
-                        category_code = href.split('%5Bladder%5D=')[-1].split('&')[0]
-                        elimination_name = link.text.strip()
-
-                        # Only include wave eliminations
-                        if 'wave' in elimination_name.lower():
-                            category_codes.append({
-                                'category_code': category_code,
-                                'elimination_name': elimination_name
-                            })
-                            self.log(f"  Found category code {category_code}: {elimination_name}")
-                    except:
-                        pass
+            for link in LADDER_LINKS_XP(tree):
+                category_code = LADDER_RE.search(link.get('href')).group(1)
+                elimination_name = link.text_content().strip()
+
+                # Only include wave eliminations
+                if 'wave' in elimination_name.lower():
+                    category_codes.append({
+                        'category_code': category_code,
+                        'elimination_name': elimination_name
+                    })
+                    self.log(f"  Found category code {category_code}: {elimination_name}")
 
+            self.category_codes_cache[event_id] = category_codes
             return category_codes
 
         except Exception as e:
             self.log(f"Error fetching category codes for event {event_id}: {e}", "ERROR")
-            self.stats['errors'] += 1
+            with self.stats_lock:
+                self.stats['errors'] += 1
             return []
 
+    def _parse_elimination(self, elimination, event_id, category_code, heat_structure, heat_results):
+        """
+        Extract heat structure and sailor results from one wave elimination block
+
+        Args:
+            elimination: <elimination> XML element
+            event_id: PWA event ID
+            category_code: Category/ladder code
+            heat_structure: List to append heat structure rows to
+            heat_results: List to append heat result rows to
+        """
+        event = elimination.findtext('event')
+        elimination_name = elimination.findtext('name')
+        sex = elimination.findtext('sex')
+        event_division_id = elimination.findtext('eventDivisionId')
+        ladder_id = elimination.findtext('ladderId')
+        e_discipline_id = elimination.findtext('eDisciplineId')
+        elimination_toadvance = elimination.findtext('toAdvance')
+
+        sex_normalized = SEX_MAP.get(sex, sex)
+
+        # Leading columns shared by every row of this elimination, built once
+        elimination_prefix = ('PWA', self.scraped_at, event_id, category_code, ladder_id, e_discipline_id)
+
+        # Loop through each round
+        for round_elem in ROUNDS_XP(elimination):
+            round_name_raw = round_elem.findtext('name')
+
+            # Try to extract toAdvance from the round; if missing or empty, fall back to elimination level
+            toadvance = round_elem.findtext('toAdvance') or elimination_toadvance
+
+            # Compute round_order and add "Round " prefix to round_name
+            if round_name_raw and round_name_raw.isdigit():
+                round_order = int(round_name_raw) - 1
+                round_name = f"Round {round_name_raw}"
+            else:
+                round_order = None
+                round_name = f"Round {round_name_raw}" if round_name_raw else None
+
+            round_prefix = elimination_prefix + (sex_normalized, elimination_name, round_name, round_order)
+
+            # Single pass over the heats: structure row, then sailor-level results
+            for heat in HEATS_XP(round_elem):
+                heat_id = heat.findtext('heatId')
+                heat_name = heat.findtext('heatName')
+
+                # heat_id, heat_order, total_winners_progressing and the three progression columns
+                heat_structure.append(HeatStructureRow(*round_prefix, heat_id, heat_name, toadvance, '', '', ''))
+
+                for sailor in SAILORS_XP(heat):
+                    sailor_name = sailor.findtext('sailorName')
+                    sail_nr = sailor.findtext('sailNr')
+                    place = sailor.findtext('place')
+
+                    # Create athlete_id by combining sailor name and number
+                    athlete_id = f"{sailor_name}_{sail_nr}" if sailor_name and sail_nr else ''
+
+                    # result_total is merged from heat scores later; win_by and needs stay blank
+                    heat_results.append(HeatResultRow(*elimination_prefix, heat_id, athlete_id, sailor_name,
+                                                      sail_nr, place, '', '', ''))
+
     def fetch_heat_structure_and_results(self, event_id, category_code):
         """
         Fetch heat structure and results from PWA XML endpoint
@@ -187,122 +307,29 @@ class PWAHeatScraper:
         xml_url = f'https://www.pwaworldtour.com/fileadmin/live_ladder/live_ladder_{category_code}.xml'
 
         try:
-            response = self.session.get(xml_url, timeout=30, verify=False)
-
-            if response.status_code != 200:
-                self.log(f"Failed to fetch XML for category {category_code}: HTTP {response.status_code}", "WARNING")
-                return [], [], []
-
-            # Parse XML
-            root = ET.fromstring(response.content)
-
             heat_structure = []
             heat_results = []
 
-            # Process each elimination block in the XML
-            for elimination in root.findall('elimination'):
-                discipline = elimination.find('discipline').text if elimination.find('discipline') is not None else None
-
-                if discipline != 'wave':
-                    continue  # Only process 'wave' discipline
-
-                event = elimination.find('event').text if elimination.find('event') is not None else None
-                elimination_name = elimination.find('name').text if elimination.find('name') is not None else None
-                sex = elimination.find('sex').text if elimination.find('sex') is not None else None
-                event_division_id = elimination.find('eventDivisionId').text if elimination.find('eventDivisionId') is not None else None
-                ladder_id = elimination.find('ladderId').text if elimination.find('ladderId') is not None else None
-                e_discipline_id = elimination.find('eDisciplineId').text if elimination.find('eDisciplineId') is not None else None
-                elimination_toadvance = elimination.find('toAdvance').text if elimination.find('toAdvance') is not None else None
-
-                # Map sex values: "male" -> "Men" and "female" -> "Women"
-                sex_mapping = {'male': 'Men', 'female': 'Women'}
-                sex_normalized = sex_mapping.get(sex, sex)
+            with self.session.get(xml_url, timeout=30, verify=False, stream=True) as response:
+                if response.status_code != 200:
+                    self.log(f"Failed to fetch XML for category {category_code}: HTTP {response.status_code}", "WARNING")
+                    return [], [], []
 
-                rounds = elimination.find('rounds')
-                if rounds is None:
-                    continue
+                # Parse straight off the socket (gzip-decoded), one elimination block at a time
+                response.raw.decode_content = True
+                for _, elimination in etree.iterparse(response.raw, events=('end',), tag='elimination',
+                                                      recover=True, huge_tree=False):
+                    # Only 'wave' eliminations are extracted; other disciplines are freed untouched
+                    if IS_WAVE_XP(elimination):
+                        self._parse_elimination(elimination, event_id, category_code, heat_structure, heat_results)
 
-                # Loop through each round
-                for round_elem in rounds.findall('round'):
-                    round_name_raw = round_elem.find('name').text if round_elem.find('name') is not None else None
-
-                    # Try to extract toAdvance from the round; if missing, fall back to elimination level
-                    round_toadvance_elem = round_elem.find('toAdvance')
-                    if round_toadvance_elem is not None and round_toadvance_elem.text is not None:
-                        toadvance = round_toadvance_elem.text
-                    else:
-                        toadvance = elimination_toadvance
-
-                    # Compute round_order and add "Round " prefix to round_name
-                    if round_name_raw and round_name_raw.isdigit():
-                        round_order = int(round_name_raw) - 1
-                        round_name = f"Round {round_name_raw}"
-                    else:
-                        round_order = None
-                        round_name = f"Round {round_name_raw}" if round_name_raw else None
-
-                    # --- Extract heat structure data ---
-                    for heat_group in round_elem.findall('heats/heatGroup'):
-                        for heat in heat_group.findall('heat'):
-                            heat_id = heat.find('heatId').text if heat.find('heatId') is not None else None
-                            heat_name = heat.find('heatName').text if heat.find('heatName') is not None else None
-
-                            heat_structure.append({
-                                'source': 'PWA',
-                                'scraped_at': self.scraped_at,
-                                'event_id': event_id,
-                                'category_code': category_code,
-                                'ladder_id': ladder_id,
-                                'e_discipline_id': e_discipline_id,
-                                'sex': sex_normalized,
-                                'elimination_name': elimination_name,
-                                'round_name': round_name,
-                                'round_order': round_order,
-                                'heat_id': heat_id,
-                                'heat_order': heat_name,
-                                'total_winners_progressing': toadvance,
-                                'winners_progressing_to_round_order': '',
-                                'total_losers_progressing': '',
-                                'losers_progressing_to_round_order': ''
-                            })
-
-                    # --- Extract sailor-level heat results ---
-                    for heat_group in round_elem.findall('heats/heatGroup'):
-                        for heat in heat_group.findall('heat'):
-                            heat_id = heat.find('heatId').text if heat.find('heatId') is not None else None
-                            heat_name = heat.find('heatName').text if heat.find('heatName') is not None else None
-                            sailors_node = heat.find('sailors')
-
-                            if sailors_node is None:
-                                continue
+                    # Free the processed block (and earlier siblings) so memory stays bounded
+                    elimination.clear()
+                    while elimination.getprevious() is not None:
+                        del elimination.getparent()[0]
 
-                            for sailor in sailors_node.findall('sailor'):
-                                sailor_name = sailor.find('sailorName').text if sailor.find('sailorName') is not None else None
-                                sail_nr = sailor.find('sailNr').text if sailor.find('sailNr') is not None else None
-                                place = sailor.find('place').text if sailor.find('place') is not None else None
-
-                                # Create athlete_id by combining sailor name and number
-                                athlete_id = f"{sailor_name}_{sail_nr}" if sailor_name and sail_nr else ''
-
-                                heat_results.append({
-                                    'source': 'PWA',
-                                    'scraped_at': self.scraped_at,
-                                    'event_id': event_id,
-                                    'category_code': category_code,
-                                    'ladder_id': ladder_id,
-                                    'e_discipline_id': e_discipline_id,
-                                    'heat_id': heat_id,
-                                    'athlete_id': athlete_id,
-                                    'sailor_name': sailor_name,
-                                    'sail_number': sail_nr,
-                                    'place': place,
-                                    'result_total': '',  # To be merged from heat scores
-                                    'win_by': '',
-                                    'needs': ''
-                                })
-
-            # Get unique heat IDs for heat scores extraction
-            unique_heat_ids = list(set([hr['heat_id'] for hr in heat_results if hr.get('heat_id')]))
+            # Get unique heat IDs for heat scores extraction (in ladder order)
+            unique_heat_ids = list(dict.fromkeys(hr.heat_id for hr in heat_results if hr.heat_id))
 
             self.log(f"  Found {len(heat_structure)} heat structure entries, {len(heat_results)} heat results, {len(unique_heat_ids)} unique heats")
 
@@ -310,9 +337,32 @@ class PWAHeatScraper:
 
         except Exception as e:
             self.log(f"Error fetching heat structure/results for category {category_code}: {e}", "ERROR")
-            self.stats['errors'] += 1
+            with self.stats_lock:
+                self.stats['errors'] += 1
             return [], [], []
 
+    def _fetch_heat_json(self, heat_id):
+        """
+        Download the live score JSON for a single heat
+
+        Args:
+            heat_id: PWA heat ID
+
+        Returns:
+            Parsed heatsheet JSON, or None if the request failed
+        """
+        api_url = f"https://www.pwaworldtour.com/fileadmin/live_score/{heat_id}.json"
+
+        try:
+            with self.session.get(api_url, timeout=30, verify=False, stream=True) as response:
+                response.raise_for_status()
+                # Decode the (gzip-decoded) body bytes directly; skips requests' charset guessing and str round trip
+                response.raw.decode_content = True
+                return json.loads(response.raw.read())
+        except Exception as e:
+            self.log(f"  Failed to fetch scores for Heat ID {heat_id}: {e}", "WARNING")
+            return None
+
     def fetch_heat_scores(self, event_id, category_code, heat_ids):
         """
         Fetch heat scores from PWA JSON endpoint
@@ -324,21 +374,29 @@ class PWAHeatScraper:
             heat_ids: List of heat IDs to fetch scores for
 
         Returns:
-            List of heat score dicts
+            List of HeatScoreRow tuples
         """
-        api_base_url = "https://www.pwaworldtour.com/fileadmin/live_score/"
         heat_scores = []
 
-        for heat_id in heat_ids:
-            try:
-                api_url = f"{api_base_url}{heat_id}.json"
-                response = self.session.get(api_url, timeout=30, verify=False)
-                response.raise_for_status()
-                heatsheet_json = response.json()
+        # Columns shared by every score row of this category, built once
+        category_const = {
+            'source': 'PWA',
+            'scraped_at': self.scraped_at,
+            'event_id': event_id,
+            'category_code': category_code,
+        }
+
+        # Download all heats of the category concurrently; rows are still built in heat order
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_FETCHES, len(heat_ids) or 1)) as pool:
+            heatsheets = list(pool.map(self._fetch_heat_json, heat_ids))
 
-                # Basic heat info
+        for heat_id, heatsheet_json in zip(heat_ids, heatsheets):
+            if heatsheet_json is None:
+                continue
+
+            try:
+                # Basic heat info (heat_id comes from the sailor's base info)
                 heat_info = {
-                    'heat_id': heatsheet_json['heat']['heatId'],
                     'heat_no': heatsheet_json['heat']['heatNo'],
                     'wave_count': heatsheet_json['heat']['waveCount'],
                     'jumps_count': heatsheet_json['heat']['jumpsCount'],
@@ -350,16 +408,11 @@ class PWAHeatScraper:
                 for sailor_info in heatsheet_json['heat']['sailors']:
                     sailor = sailor_info['sailor']
 
-                    # Normalize sailor name
-                    sailor_name = unicodedata.normalize('NFKD', sailor.get('sailorName', ''))
                     sail_no = sailor.get('sailNo', '')
                     athlete_id = f"{sailor.get('sailorName', '')}_{sail_no}" if sailor.get('sailorName') and sail_no else ''
 
                     base_info = {
-                        'source': 'PWA',
-                        'scraped_at': self.scraped_at,
-                        'event_id': event_id,
-                        'category_code': category_code,
+                        **category_const,
                         'heat_id': heat_id,
                         'athlete_id': athlete_id,
                         'sailor_name': sailor.get('sailorName', ''),
@@ -370,27 +423,26 @@ class PWAHeatScraper:
                         'position': sailor.get('totalPos', ''),
                     }
 
-                    combined_info = {**heat_info, **base_info}
-
                     # Process each score (wave or jump)
                     for score_type, score_list in sailor.get('scores', {}).items():
                         for score in score_list:
                             if not isinstance(score, dict):
                                 continue
 
-                            row = combined_info.copy()
-                            row['type'] = 'Wave' if score_type == 'wave' else score.get('type', '')
-                            row['score'] = score.get('score', None)
-                            row['counting'] = 'Yes' if score.get('counting') else 'No'
-                            row['modified_total'] = ''
-                            row['modifier'] = ''
-
-                            heat_scores.append(row)
+                            heat_scores.append(HeatScoreRow(
+                                **heat_info,
+                                **base_info,
+                                type='Wave' if score_type == 'wave' else score.get('type', ''),
+                                score=score.get('score', None),
+                                counting='Yes' if score.get('counting') else 'No',
+                                modified_total='',
+                                modifier=''
+                            ))
 
                 self.log(f"  Successfully fetched scores for Heat ID {heat_id}")
 
             except Exception as e:
-                self.log(f"  Failed to fetch scores for Heat ID {heat_id}: {e}", "WARNING")
+                self.log(f"  Failed to parse scores for Heat ID {heat_id}: {e}", "WARNING")
                 continue
 
         return heat_scores
@@ -399,19 +451,26 @@ class PWAHeatScraper:
         """
         Scrape all heat data for a single event (all eliminations)
 
+        Runs on a worker thread: rows are returned rather than added to the
+        scraper's lists, so scrape_all_events can merge events in order.
+
         Args:
             event_id: PWA event ID
             event_name: Event name
             year: Event year
 
         Returns:
-            Dict with flags indicating what heat data was found
+            Tuple of (heat flags dict, heat_structure list, heat_results list, heat_scores list)
         """
         self.log(f"\n{'='*80}")
         self.log(f"Processing Event: {event_name} ({year})")
         self.log(f"Event ID: {event_id}")
         self.log(f"{'='*80}")
 
+        event_structure = []
+        event_results = []
+        event_scores = []
+
         # Step 1: Fetch all category codes (eliminations) for this event
         category_codes = self.fetch_category_codes(event_id)
 
@@ -423,15 +482,10 @@ class PWAHeatScraper:
                 'has_heat_scores': False,
                 'heat_count': 0,
                 'category_count': 0
-            }
+            }, event_structure, event_results, event_scores
 
         self.log(f"Found {len(category_codes)} elimination ladder(s)")
 
-        total_has_structure = False
-        total_has_results = False
-        total_has_scores = False
-        total_heat_count = 0
-
         # Step 2: For each category code, fetch heat structure, results, and scores
         for cat_info in category_codes:
             category_code = cat_info['category_code']
@@ -441,20 +495,7 @@ class PWAHeatScraper:
 
             # Fetch heat structure and results
             heat_structure, heat_results, heat_ids = self.fetch_heat_structure_and_results(event_id, category_code)
-
-            has_structure = len(heat_structure) > 0
-            has_results = len(heat_results) > 0
-            has_scores = False
-
-            if has_structure:
-                self.heat_structure_data.extend(heat_structure)
-                total_has_structure = True
-                total_heat_count += len(heat_structure)
-                self.stats['total_heats'] += len(heat_structure)
-
-            if has_results:
-                total_has_results = True
-                self.stats['total_heat_results'] += len(heat_results)
+            event_structure.extend(heat_structure)
 
             # Fetch heat scores if we have heat IDs
             if heat_ids:
@@ -462,48 +503,51 @@ class PWAHeatScraper:
                 heat_scores = self.fetch_heat_scores(event_id, category_code, heat_ids)
 
                 if heat_scores:
-                    has_scores = True
-                    total_has_scores = True
-                    self.heat_scores_data.extend(heat_scores)
-                    self.stats['total_heat_scores'] += len(heat_scores)
-
-                    # Merge total_points into heat_results
-                    scores_df = pd.DataFrame(heat_scores)
-                    if not scores_df.empty and 'total_points' in scores_df.columns:
-                        total_points_df = scores_df[['event_id', 'heat_id', 'athlete_id', 'total_points']].drop_duplicates()
-
-                        # Update heat_results with total_points
-                        for hr in heat_results:
-                            matching = total_points_df[
-                                (total_points_df['event_id'] == hr['event_id']) &
-                                (total_points_df['heat_id'] == hr['heat_id']) &
-                                (total_points_df['athlete_id'] == hr['athlete_id'])
-                            ]
-                            if not matching.empty:
-                                hr['result_total'] = matching.iloc[0]['total_points']
+                    event_scores.extend(heat_scores)
+
+                    # Merge total_points into heat_results (first score row per sailor wins)
+                    total_points = {}
+                    for score_row in heat_scores:
+                        total_points.setdefault(
+                            (score_row.event_id, score_row.heat_id, score_row.athlete_id),
+                            score_row.total_points
+                        )
+
+                    heat_results = [
+                        hr._replace(result_total=total_points.get((hr.event_id, hr.heat_id, hr.athlete_id), ''))
+                        for hr in heat_results
+                    ]
 
                 # Add updated heat_results to main list
-                if heat_results:
-                    self.heat_results_data.extend(heat_results)
+                event_results.extend(heat_results)
 
             time.sleep(1)  # Be nice to the server between categories
 
-        # Update stats
-        self.stats['total_events'] += 1
-        if total_has_structure:
-            self.stats['events_with_heat_structure'] += 1
-        if total_has_results:
-            self.stats['events_with_heat_results'] += 1
-        if total_has_scores:
-            self.stats['events_with_heat_scores'] += 1
-
         return {
-            'has_heat_structure': total_has_structure,
-            'has_heat_results': total_has_results,
-            'has_heat_scores': total_has_scores,
-            'heat_count': total_heat_count,
+            'has_heat_structure': len(event_structure) > 0,
+            'has_heat_results': len(event_results) > 0,
+            'has_heat_scores': len(event_scores) > 0,
+            'heat_count': len(event_structure),
             'category_count': len(category_codes)
-        }
+        }, event_structure, event_results, event_scores
+
+    def _scrape_event(self, event_row):
+        """
+        Scrape one event row, logging instead of raising on failure
+
+        Args:
+            event_row: Named tuple with event_id, event_name and year
+
+        Returns:
+            Result of scrape_event_heat_data, or None if the event failed
+        """
+        try:
+            return self.scrape_event_heat_data(str(event_row.event_id), event_row.event_name, event_row.year)
+        except Exception as e:
+            self.log(f"FATAL ERROR processing event {event_row.event_id}: {e}", "ERROR")
+            with self.stats_lock:
+                self.stats['errors'] += 1
+            return None
 
     def scrape_all_events(self):
         """Scrape heat data for all events"""
@@ -523,27 +567,46 @@ class PWAHeatScraper:
 
         total_events = len(events_df)
         self.log(f"\n{'='*80}")
-        self.log(f"Starting scrape of {total_events} events")
+        self.log(f"Starting scrape of {total_events} events ({min(MAX_CONCURRENT_EVENTS, total_events)} at a time)")
         self.log(f"{'='*80}\n")
 
         # Track heat data availability per event
         heat_data_tracking = []
 
-        for idx, (_, event_row) in enumerate(events_df.iterrows(), 1):
-            self.log(f"\n--- Event {idx}/{total_events} ---")
+        # Events hit independent ladder/score files, so several are scraped at once;
+        # the bounded pool replaces the fixed pause between events. pool.map yields
+        # results in event order, so rows are merged deterministically here.
+        event_rows = list(events_df.itertuples(index=False))
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_EVENTS, total_events)) as pool:
+            for idx, (event_row, scraped) in enumerate(zip(event_rows, pool.map(self._scrape_event, event_rows)), 1):
+                if scraped is None:
+                    continue
+
+                heat_flags, heat_structure, heat_results, heat_scores = scraped
+                self.log(f"--- Event {idx}/{total_events} done: {event_row.event_name} ---")
 
-            try:
-                event_id = str(event_row['event_id'])
-                event_name = event_row['event_name']
-                year = event_row['year']
+                self._collect_rows('structure', heat_structure, self.heat_structure_data)
+                self._collect_rows('results', heat_results, self.heat_results_data)
+                self._collect_rows('scores', heat_scores, self.heat_scores_data)
 
-                heat_flags = self.scrape_event_heat_data(event_id, event_name, year)
+                # Update stats (events without elimination ladders are not counted as processed)
+                if heat_flags['category_count']:
+                    self.stats['total_events'] += 1
+                self.stats['total_heats'] += len(heat_structure)
+                self.stats['total_heat_results'] += len(heat_results)
+                self.stats['total_heat_scores'] += len(heat_scores)
+                if heat_flags['has_heat_structure']:
+                    self.stats['events_with_heat_structure'] += 1
+                if heat_flags['has_heat_results']:
+                    self.stats['events_with_heat_results'] += 1
+                if heat_flags['has_heat_scores']:
+                    self.stats['events_with_heat_scores'] += 1
 
                 # Store tracking info
                 heat_data_tracking.append({
-                    'event_id': event_id,
-                    'event_name': event_name,
-                    'year': year,
+                    'event_id': str(event_row.event_id),
+                    'event_name': event_row.event_name,
+                    'year': event_row.year,
                     'has_heat_structure': heat_flags['has_heat_structure'],
                     'has_heat_results': heat_flags['has_heat_results'],
                     'has_heat_scores': heat_flags['has_heat_scores'],
@@ -551,17 +614,65 @@ class PWAHeatScraper:
                     'category_count': heat_flags['category_count']
                 })
 
-                time.sleep(2)  # Be nice to the server between events
-
-            except Exception as e:
-                self.log(f"FATAL ERROR processing event {event_row['event_id']}: {e}", "ERROR")
-                self.stats['errors'] += 1
-                continue
-
         self.print_summary()
 
         return pd.DataFrame(heat_data_tracking)
 
+    def stream_results_to(self, structure_path, results_path, scores_path):
+        """
+        Write heat rows to CSV as each event finishes instead of keeping them in memory
+
+        Each file is opened (and its header written) when its first rows arrive,
+        so a run that finds no data leaves the existing CSV untouched. Rows go
+        to '<path>.tmp', which save_results() closes and moves over the output,
+        so an interrupted run never replaces a complete CSV with a partial one.
+
+        Args:
+            structure_path: Path for heat structure CSV
+            results_path: Path for heat results CSV
+            scores_path: Path for heat scores CSV
+        """
+        self.output_paths = {'structure': structure_path, 'results': results_path, 'scores': scores_path}
+
+    def _collect_rows(self, kind, rows, collected):
+        """
+        Append one event's rows to the streamed CSV, or to the in-memory list when not streaming
+
+        Args:
+            kind: 'structure', 'results' or 'scores'
+            rows: Row tuples for one event
+            collected: In-memory list for this kind of row
+        """
+        if self.output_paths is None:
+            collected.extend(rows)
+            return
+
+        if not rows:
+            return
+
+        if kind not in self.output_files:
+            fh = open(f"{self.output_paths[kind]}.tmp", 'w', newline='', encoding='utf-8-sig')
+            writer = csv.writer(fh, lineterminator='\n')
+            writer.writerow(rows[0]._fields)
+            self.output_files[kind] = (fh, writer)
+
+        fh, writer = self.output_files[kind]
+        writer.writerows(rows)
+        fh.flush()
+
+    def abort(self):
+        """
+        Close and delete any streamed temp files, leaving the existing CSVs untouched
+
+        Does nothing once save_results() has moved the files into place.
+        """
+        for kind in list(self.output_files):
+            self.output_files.pop(kind)[0].close()
+            tmp_path = f"{self.output_paths[kind]}.tmp"
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+                self.log(f"Discarded partial output: {tmp_path}", "WARNING")
+
     def print_summary(self):
         """Print scraping statistics"""
         self.log(f"\n{'='*80}")
@@ -586,9 +697,23 @@ class PWAHeatScraper:
             results_path: Path for heat results CSV
             scores_path: Path for heat scores CSV
         """
+        if self.output_paths is not None:
+            # Rows were already streamed to temp files; close them and move them into place
+            for kind, label, stat in (('structure', 'Heat structure', 'total_heats'),
+                                      ('results', 'Heat results', 'total_heat_results'),
+                                      ('scores', 'Heat scores', 'total_heat_scores')):
+                if kind in self.output_files:
+                    self.output_files.pop(kind)[0].close()
+                    os.replace(f"{self.output_paths[kind]}.tmp", self.output_paths[kind])
+                    self.log(f"{label} saved to: {self.output_paths[kind]}")
+                    self.log(f"Total rows: {self.stats[stat]}")
+                else:
+                    self.log(f"WARNING: No {label.lower()} data to save!", "WARNING")
+            return
+
         # Save heat structure
         if self.heat_structure_data:
-            structure_df = pd.DataFrame(self.heat_structure_data)
+            structure_df = pd.DataFrame.from_records(self.heat_structure_data, columns=HeatStructureRow._fields)
             structure_df.to_csv(structure_path, index=False, encoding='utf-8-sig')
             self.log(f"Heat structure saved to: {structure_path}")
             self.log(f"Total rows: {len(structure_df)}")
@@ -597,7 +722,7 @@ class PWAHeatScraper:
 
         # Save heat results
         if self.heat_results_data:
-            results_df = pd.DataFrame(self.heat_results_data)
+            results_df = pd.DataFrame.from_records(self.heat_results_data, columns=HeatResultRow._fields)
             results_df.to_csv(results_path, index=False, encoding='utf-8-sig')
             self.log(f"Heat results saved to: {results_path}")
             self.log(f"Total rows: {len(results_df)}")
@@ -606,7 +731,7 @@ class PWAHeatScraper:
 
         # Save heat scores
         if self.heat_scores_data:
-            scores_df = pd.DataFrame(self.heat_scores_data)
+            scores_df = pd.DataFrame.from_records(self.heat_scores_data, columns=HeatScoreRow._fields)
             scores_df.to_csv(scores_path, index=False, encoding='utf-8-sig')
             self.log(f"Heat scores saved to: {scores_path}")
             self.log(f"Total rows: {len(scores_df)}")
@@ -653,6 +778,7 @@ def main():
 
     # Initialize scraper
     scraper = PWAHeatScraper(tracking_csv)
+    scraper.stream_results_to(structure_csv, results_csv, scores_csv)
 
     try:
         # Scrape all events
@@ -672,6 +798,10 @@ def main():
         import traceback
         traceback.print_exc()
 
+    finally:
+        # Discard partial temp files if the run did not reach save_results()
+        scraper.abort()
+
 
 if __name__ == "__main__":
     main()
@@ -5,38 +5,224 @@ Input: pwa_events_raw.csv (wave events only)
 Output: pwa_wave_results_raw.csv
 """
 
+import os
 import time
+import codecs
+import hashlib
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import pandas as pd
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
+from lxml import etree
 import urllib3
 
+# Run as a script from src/scrapers, or imported as scrapers.pwa_results_scraper
+# by the incremental updater
+try:
+    from csv_writer import write_dataframe_csv
+except ImportError:
+    from scrapers.csv_writer import write_dataframe_csv
+
 # Disable SSL warnings (PWA site has SSL issues)
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Maximum number of events scraped at once
+MAX_CONCURRENT_EVENTS = 4
+
+# Maximum number of division results pages fetched at once per event
+MAX_CONCURRENT_DIVISIONS = 4
+
+# Pooled keep-alive connections to the PWA site, one per page fetched at once
+HTTP_POOL_SIZE = MAX_CONCURRENT_EVENTS * MAX_CONCURRENT_DIVISIONS
+
+# Results pages can be kept on disk between runs (opt-in, see use_cache)
+CACHE_DIR = 'data/cache'
+PAGE_CACHE_DIR = f'{CACHE_DIR}/pwa_results_pages'
+PAGE_CACHE_TTL = 30 * 24 * 60 * 60  # seconds
+
+# Discipline (division) code in a division results link
+DISCIPLINE_RE = re.compile(r"tx_pwaevent_pi1%5BeventDiscipline%5D=(\d+)")
+
+# Division results page: first table, its rows and cells, and the athlete link
+RESULTS_TABLE_XP = etree.XPath('(//table)[1]')
+TABLE_ROWS_XP = etree.XPath('.//tr')
+ROW_CELLS_XP = etree.XPath('.//td')
+RANK_NAME_XP = etree.XPath('.//div[contains(concat(" ", normalize-space(@class), " "), " rank-name ")]')
+LINK_HREFS_XP = etree.XPath('.//a/@href')
+
+# PWA athlete ID in a sailor link: tx_pwasailor_pi1%5BshowUid%5D=791 or showUid=791
+ATHLETE_ID_RE = re.compile(r'(?:tx_pwasailor_pi1%5BshowUid%5D|showUid)=(\d+)')
+
+# Results pages are UTF-8 but may carry no charset declaration, which lxml
+# would otherwise read as latin-1. Parsers are reused across pages, one set
+# per worker thread (see thread_parsers)
+PARSER_STATE = threading.local()
+
+
+class DivisionLinksTarget:
+    """
+    lxml parser target collecting the division links of an event results page
+
+    The links live in the first <ul>; a page without any list falls back to
+    every anchor. Only anchors are tracked, so no tree is built. Like
+    get_text(strip=True), a label joins the anchor's stripped text nodes.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Forget the page parsed so far"""
+        self.seen_ul = False
+        self.first_ul_depth = 0  # Open <ul> elements within the first list
+        self.open_anchors = []  # Label parts of each open anchor (None without an href)
+        self.chunks = []  # Pieces of the current text node
+        self.ul_links = []
+        self.all_links = []
+
+    def flush_text(self):
+        """Close the current text node, adding it to every open anchor"""
+        if self.chunks:
+            text = ''.join(self.chunks).strip()
+            self.chunks = []
+            for parts in self.open_anchors:
+                if parts is not None:
+                    parts.append(text)
+
+    def start(self, tag, attrib):
+        self.flush_text()
+        if tag == 'ul':
+            if self.first_ul_depth:
+                self.first_ul_depth += 1
+            elif not self.seen_ul:
+                self.seen_ul = True
+                self.first_ul_depth = 1
+        elif tag == 'a':
+            href = attrib.get('href')
+            if href is None:
+                self.open_anchors.append(None)
+                return
+            # Links are listed in document order, so the slot is taken on the start tag
+            link = [[], href]
+            self.open_anchors.append(link[0])
+            self.all_links.append(link)
+            if self.first_ul_depth:
+                self.ul_links.append(link)
+
+    def end(self, tag):
+        self.flush_text()
+        if tag == 'a' and self.open_anchors:
+            self.open_anchors.pop()
+        elif tag == 'ul' and self.first_ul_depth:
+            self.first_ul_depth -= 1
+
+    def data(self, data):
+        if self.open_anchors:
+            self.chunks.append(data)
+
+    def comment(self, text):
+        # A comment splits the text around it into separate text nodes
+        self.flush_text()
+
+    def close(self):
+        """
+        Finish the page
+
+        Returns:
+            List of (label, href) tuples
+        """
+        links = self.ul_links if self.seen_ul else self.all_links
+        self.reset()
+        return [(''.join(parts), href) for parts, href in links]
+
+
+def thread_parsers():
+    """
+    This thread's reusable lxml parsers, created on first use
+
+    Returns:
+        Tuple of (division links parser, results table parser)
+    """
+    if not hasattr(PARSER_STATE, 'parsers'):
+        PARSER_STATE.parsers = (
+            etree.HTMLParser(target=DivisionLinksTarget(), encoding='utf-8'),
+            # Comments stay in the tree: they split the text around them into separate
+            # nodes, which stripped_text() strips one by one (as get_text(strip=True))
+            etree.HTMLParser(encoding='utf-8', remove_blank_text=True)
+        )
+    return PARSER_STATE.parsers
+
+
+def stripped_text(element):
+    """
+    Text of an element with each text node stripped, as get_text(strip=True)
+
+    Args:
+        element: lxml element
+
+    Returns:
+        Concatenated stripped text
+    """
+    return ''.join(text.strip() for text in element.itertext())
+
+
+def write_csv(rows, path):
+    """
+    Write row dicts to CSV with the shared pyarrow writer
+
+    A UTF-8 BOM is written first, as with encoding='utf-8-sig'.
+
+    Args:
+        rows: List of row dicts (keys of the first row are the columns)
+        path: Output CSV path
+    """
+    with open(path, 'wb') as f:
+        f.write(codecs.BOM_UTF8)
+        write_csv_rows(rows, f)
+
+
+def write_csv_rows(rows, f, include_header=True):
+    """
+    Write row dicts to an open binary file with pyarrow's CSV writer
+
+    Shared by write_csv and the streamed results file so both quote fields
+    the same way.
+
+    Args:
+        rows: List of row dicts (keys of the first row are the columns)
+        f: File opened in binary mode
+        include_header: Whether to write the header row first
+    """
+    # Object columns keep each value's own type, as Table.from_pylist would
+    write_dataframe_csv(pd.DataFrame(rows, dtype=object), f, include_header)
+
 
 class PWAResultsScraper:
     """Scraper for PWA wave event final results"""
 
-    def __init__(self, events_csv_path=None, events_df=None):
+    def __init__(self, events_csv_path=None, events_df=None, use_cache=False):
         """
         Initialize the scraper
 
         Args:
             events_csv_path: Path to PWA events CSV file (optional if events_df provided)
             events_df: DataFrame with PWA events (optional if events_csv_path provided)
+            use_cache: Reuse results pages fetched by earlier runs, up to PAGE_CACHE_TTL old (default: False)
         """
         if events_csv_path is None and events_df is None:
             raise ValueError("Either events_csv_path or events_df must be provided")
 
         self.events_csv_path = events_csv_path
         self.events_df = events_df
+        self.use_cache = use_cache
         self.results_data = []
         self.division_data = []
+        self.results_path = None  # Set by stream_results_to()
+        self.results_file = None
         self.scraped_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         # Create session with retry logic
@@ -51,6 +237,7 @@ class PWAResultsScraper:
             'total_athletes': 0,
             'errors': 0
         }
+        self.stats_lock = threading.Lock()
 
     def _create_session(self):
         """Create requests session with retry logic and SSL handling"""
@@ -64,12 +251,44 @@ class PWAResultsScraper:
             allowed_methods=["HEAD", "GET", "OPTIONS"]
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=HTTP_POOL_SIZE,
+                              pool_maxsize=HTTP_POOL_SIZE)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
         return session
 
+    def _fetch_page(self, url):
+        """
+        Fetch a results page, from the on-disk cache when enabled and fresh
+
+        Only successful responses are cached.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Tuple of (HTTP status code, page body bytes)
+        """
+        cache_path = None
+        if self.use_cache:
+            cache_path = f"{PAGE_CACHE_DIR}/{hashlib.sha1(url.encode()).hexdigest()}.html"
+            if os.path.exists(cache_path) and os.path.getmtime(cache_path) > time.time() - PAGE_CACHE_TTL:
+                with open(cache_path, 'rb') as f:
+                    return 200, f.read()
+
+        response = self.session.get(url, timeout=30, verify=False)
+
+        if cache_path and response.status_code == 200:
+            # Write then rename, so a concurrent reader never sees a partial page
+            os.makedirs(PAGE_CACHE_DIR, exist_ok=True)
+            tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(response.content)
+            os.replace(tmp_path, cache_path)
+
+        return response.status_code, response.content
+
     def log(self, message, level="INFO"):
         """Print timestamped log message"""
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -116,28 +335,21 @@ class PWAResultsScraper:
         url = f"https://www.pwaworldtour.com/index.php?id=193&type=21&tx_pwaevent_pi1%5Baction%5D=results&tx_pwaevent_pi1%5BshowUid%5D={event_id}"
 
         try:
-            response = self.session.get(url, timeout=30, verify=False)
-            if response.status_code != 200:
-                self.log(f"Failed to fetch results page for event {event_id}: HTTP {response.status_code}", "ERROR")
+            status_code, content = self._fetch_page(url)
+            if status_code != 200:
+                self.log(f"Failed to fetch results page for event {event_id}: HTTP {status_code}", "ERROR")
                 return {}
 
-            soup = BeautifulSoup(response.content, 'lxml')
-
-            # Find all links in the page
-            container = soup.find('ul')
-            links = container.find_all('a', href=True) if container else soup.find_all('a', href=True)
-
-            # Regex pattern to extract discipline code
-            pattern = r"tx_pwaevent_pi1%5BeventDiscipline%5D=(\d+)"
+            # Division links as (label, href), streamed out of the page by the parser target
+            links_parser = thread_parsers()[0]
+            links_parser.target.reset()  # In case an earlier page failed mid-parse
+            links = etree.fromstring(content, links_parser) or []
 
             wave_divisions = {}
-            for link in links:
-                label = link.get_text(strip=True)
-                href = link.get('href')
-
+            for label, href in links:
                 # Check if the label contains "wave" (case-insensitive)
                 if "wave" in label.lower():
-                    match = re.search(pattern, href)
+                    match = DISCIPLINE_RE.search(href)
                     if match:
                         division_code = match.group(1)
                         wave_divisions[label] = division_code
@@ -147,7 +359,8 @@ class PWAResultsScraper:
 
         except Exception as e:
             self.log(f"Error extracting division links for event {event_id}: {e}", "ERROR")
-            self.stats['errors'] += 1
+            with self.stats_lock:
+                self.stats['errors'] += 1
             return {}
 
     def extract_division_results(self, event_id, division_label, division_code, event_info):
@@ -166,58 +379,57 @@ class PWAResultsScraper:
         url = f"https://www.pwaworldtour.com/index.php?id=193&type=21&tx_pwaevent_pi1%5Baction%5D=results&tx_pwaevent_pi1%5BshowUid%5D={event_id}&tx_pwaevent_pi1%5BeventDiscipline%5D={division_code}"
 
         try:
-            response = self.session.get(url, timeout=30, verify=False)
-            if response.status_code != 200:
-                self.log(f"Failed to fetch division results: HTTP {response.status_code}", "WARNING")
+            status_code, content = self._fetch_page(url)
+            if status_code != 200:
+                self.log(f"Failed to fetch division results: HTTP {status_code}", "WARNING")
                 return []
 
-            soup = BeautifulSoup(response.content, 'lxml')
-
-            # Find the results table
-            table = soup.find('table')
-            if table is None:
+            # Find the results table (an empty page parses to no document)
+            tree = etree.fromstring(content, thread_parsers()[1])
+            tables = RESULTS_TABLE_XP(tree) if tree is not None else []
+            if not tables:
                 self.log(f"  No results table found for {division_label}", "WARNING")
                 return []
 
+            # Values shared by every row of the division
+            sex = "Women" if "women" in division_label.lower() else "Men"
+            year = event_info.get('year', '')
+            event_name = event_info.get('event_name', '')
+
             # Parse table rows (skip header)
-            rows = table.find_all('tr')
+            rows = TABLE_ROWS_XP(tables[0])
             results = []
 
             for row in rows[1:]:  # Skip header row
-                cols = row.find_all('td')
+                cols = ROW_CELLS_XP(row)
                 if len(cols) < 6:
                     continue  # Skip rows without enough columns
 
                 # Extract data from columns
                 try:
-                    place = cols[0].get_text(strip=True)
+                    place = stripped_text(cols[0])
 
                     # Name might be in a div with class 'rank-name', which contains an <a> tag
-                    name_div = cols[1].find('div', class_='rank-name')
-                    name = name_div.get_text(strip=True) if name_div else cols[1].get_text(strip=True)
+                    name_divs = RANK_NAME_XP(cols[1])
+                    name = stripped_text(name_divs[0] if name_divs else cols[1])
 
                     # Extract PWA athlete ID from href (if available)
                     pwa_athlete_id = ''
-                    if name_div:
-                        athlete_link = name_div.find('a', href=True)
-                        if athlete_link:
-                            href = athlete_link.get('href', '')
-                            # Pattern: tx_pwasailor_pi1%5BshowUid%5D=791 or showUid=791
-                            match = re.search(r'(?:tx_pwasailor_pi1%5BshowUid%5D|showUid)=(\d+)', href)
+                    if name_divs:
+                        hrefs = LINK_HREFS_XP(name_divs[0])
+                        if hrefs:
+                            match = ATHLETE_ID_RE.search(hrefs[0])
                             if match:
                                 pwa_athlete_id = match.group(1)
 
-                    sail_no = cols[2].get_text(strip=True)
-
-                    # Determine sex from division label
-                    sex = "Women" if "women" in division_label.lower() else "Men"
+                    sail_no = stripped_text(cols[2])
 
                     result = {
                         'source': 'PWA',
                         'scraped_at': self.scraped_at,
                         'event_id': event_id,
-                        'year': event_info.get('year', ''),
-                        'event_name': event_info.get('event_name', ''),
+                        'year': year,
+                        'event_name': event_name,
                         'division_label': division_label,
                         'division_code': division_code,
                         'sex': sex,
@@ -228,7 +440,6 @@ class PWAResultsScraper:
                     }
 
                     results.append(result)
-                    self.stats['total_athletes'] += 1
 
                 except Exception as e:
                     self.log(f"  Error parsing row: {e}", "WARNING")
@@ -239,38 +450,39 @@ class PWAResultsScraper:
 
         except Exception as e:
             self.log(f"Error extracting results for division {division_label}: {e}", "ERROR")
-            self.stats['errors'] += 1
+            with self.stats_lock:
+                self.stats['errors'] += 1
             return []
 
     def scrape_event_results(self, event_row):
         """
         Scrape all wave division results for a single event
 
+        Runs on a worker thread: the event's division info and result rows are
+        returned rather than stored, so scrape_all_events can merge events in order.
+
         Args:
-            event_row: Pandas Series with event data
+            event_row: Named tuple with event_id, event_name and year
 
         Returns:
-            Number of divisions processed
+            Tuple of (division info dict, list of result dicts)
         """
-        event_id = str(event_row['event_id'])
-        event_name = event_row['event_name']
-        year = event_row['year']
+        event_id = str(event_row.event_id)
+        event_name = event_row.event_name
+        year = event_row.year
 
         self.log(f"\n{'='*80}")
         self.log(f"Processing Event {event_id}: {event_name} ({year})")
         self.log(f"{'='*80}")
 
-        self.stats['total_events'] += 1
-
         # Extract wave division links
         wave_divisions = self.extract_wave_division_links(event_id)
 
         if not wave_divisions:
             self.log(f"No wave divisions found or no results available for event {event_id}", "WARNING")
-            self.stats['events_without_results'] += 1
 
             # Store division info even if no results
-            self.division_data.append({
+            return {
                 'source': 'PWA',
                 'event_id': event_id,
                 'year': year,
@@ -279,11 +491,10 @@ class PWAResultsScraper:
                 'division_count': 0,
                 'division_labels': '',
                 'division_codes': ''
-            })
-            return 0
+            }, []
 
         # Store division info
-        self.division_data.append({
+        division_info = {
             'source': 'PWA',
             'event_id': event_id,
             'year': year,
@@ -292,10 +503,7 @@ class PWAResultsScraper:
             'division_count': len(wave_divisions),
             'division_labels': ', '.join(wave_divisions.keys()),
             'division_codes': ', '.join(wave_divisions.values())
-        })
-
-        self.stats['events_with_results'] += 1
-        self.stats['total_divisions'] += len(wave_divisions)
+        }
 
         # Event metadata for results
         event_info = {
@@ -303,21 +511,39 @@ class PWAResultsScraper:
             'event_name': event_name
         }
 
-        # Extract results for each wave division
-        divisions_processed = 0
-        for division_label, division_code in wave_divisions.items():
+        def scrape_division(division):
+            division_label, division_code = division
             self.log(f"\nScraping division: {division_label}")
-            results = self.extract_division_results(
+            return self.extract_division_results(
                 event_id, division_label, division_code, event_info
             )
 
-            if results:
-                self.results_data.extend(results)
-                divisions_processed += 1
+        # Extract results for each wave division. The division pages are independent,
+        # so they are fetched at once; pool.map keeps the rows in division order
+        event_results = []
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_DIVISIONS, len(wave_divisions))) as pool:
+            for results in pool.map(scrape_division, wave_divisions.items()):
+                event_results.extend(results)
 
-            time.sleep(1)  # Be nice to the server
+        return division_info, event_results
 
-        return divisions_processed
+    def _scrape_event(self, event_row):
+        """
+        Scrape one event row, logging instead of raising on failure
+
+        Args:
+            event_row: Named tuple with event_id, event_name and year
+
+        Returns:
+            Result of scrape_event_results, or None if the event failed
+        """
+        try:
+            return self.scrape_event_results(event_row)
+        except Exception as e:
+            self.log(f"FATAL ERROR processing event {event_row.event_id}: {e}", "ERROR")
+            with self.stats_lock:
+                self.stats['errors'] += 1
+            return None
 
     def scrape_all_events(self):
         """Scrape results for all wave events"""
@@ -329,23 +555,87 @@ class PWAResultsScraper:
 
         total_events = len(wave_events)
         self.log(f"\n{'='*80}")
-        self.log(f"Starting scrape of {total_events} wave events")
+        self.log(f"Starting scrape of {total_events} wave events ({min(MAX_CONCURRENT_EVENTS, total_events)} at a time)")
         self.log(f"{'='*80}\n")
 
-        for idx, (_, event_row) in enumerate(wave_events.iterrows(), 1):
-            self.log(f"\n--- Event {idx}/{total_events} ---")
+        # Events are independent pages, so several are scraped at once; the bounded
+        # pool replaces the fixed pause between events. pool.map yields results in
+        # event order, so rows and stats are merged deterministically here.
+        event_rows = list(wave_events[['event_id', 'event_name', 'year']].itertuples(index=False, name='Event'))
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_EVENTS, total_events)) as pool:
+            for idx, scraped in enumerate(pool.map(self._scrape_event, event_rows), 1):
+                if scraped is None:
+                    continue
 
-            try:
-                self.scrape_event_results(event_row)
-                time.sleep(2)  # Be nice to the server between events
+                division_info, results = scraped
+                self.log(f"--- Event {idx}/{total_events} done: {division_info['event_name']} ---")
 
-            except Exception as e:
-                self.log(f"FATAL ERROR processing event {event_row['event_id']}: {e}", "ERROR")
-                self.stats['errors'] += 1
-                continue
+                self.division_data.append(division_info)
+                self._collect_results(results)
+
+                self.stats['total_events'] += 1
+                if division_info['has_results']:
+                    self.stats['events_with_results'] += 1
+                    self.stats['total_divisions'] += division_info['division_count']
+                else:
+                    self.stats['events_without_results'] += 1
+                self.stats['total_athletes'] += len(results)
 
         self.print_summary()
 
+    def stream_results_to(self, results_path):
+        """
+        Write result rows to CSV as each event finishes instead of keeping them in memory
+
+        The file is opened (and its header written) when the first rows arrive,
+        so a run that finds no results leaves the existing CSV untouched. Rows
+        go to '<path>.tmp', which save_results() closes and moves over the
+        output, so an interrupted run never replaces a complete CSV with a
+        partial one.
+
+        Args:
+            results_path: Path for results CSV
+        """
+        self.results_path = results_path
+
+    def _collect_results(self, results):
+        """
+        Append one event's results to the streamed CSV, or to results_data when not streaming
+
+        Args:
+            results: List of result dicts for one event
+        """
+        if self.results_path is None:
+            self.results_data.extend(results)
+            return
+
+        if not results:
+            return
+
+        include_header = self.results_file is None
+        if include_header:
+            self.results_file = open(f"{self.results_path}.tmp", 'wb')
+            self.results_file.write(codecs.BOM_UTF8)
+
+        write_csv_rows(results, self.results_file, include_header)
+        self.results_file.flush()
+
+    def abort(self):
+        """
+        Close and delete the streamed temp file, leaving the existing CSV untouched
+
+        Does nothing once save_results() has moved the file into place.
+        """
+        if self.results_file is None:
+            return
+
+        self.results_file.close()
+        self.results_file = None
+        tmp_path = f"{self.results_path}.tmp"
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+            self.log(f"Discarded partial output: {tmp_path}", "WARNING")
+
     def print_summary(self):
         """Print scraping statistics"""
         self.log(f"\n{'='*80}")
@@ -368,11 +658,20 @@ class PWAResultsScraper:
             divisions_output_path: Path for divisions CSV
         """
         # Save results
-        if self.results_data:
-            results_df = pd.DataFrame(self.results_data)
-            results_df.to_csv(results_output_path, index=False, encoding='utf-8-sig')
+        if self.results_path is not None:
+            # Rows were already streamed to a temp file; close it and move it into place
+            if self.results_file is not None:
+                self.results_file.close()
+                self.results_file = None
+                os.replace(f"{self.results_path}.tmp", self.results_path)
+                self.log(f"Results saved to: {self.results_path}")
+                self.log(f"Total rows: {self.stats['total_athletes']}")
+            else:
+                self.log("WARNING: No results data to save!", "WARNING")
+        elif self.results_data:
+            write_csv(self.results_data, results_output_path)
             self.log(f"Results saved to: {results_output_path}")
-            self.log(f"Total rows: {len(results_df)}")
+            self.log(f"Total rows: {len(self.results_data)}")
         else:
             self.log("WARNING: No results data to save!", "WARNING")
 
@@ -386,8 +685,35 @@ class PWAResultsScraper:
             self.log("WARNING: No division data to save!", "WARNING")
 
 
-def main():
-    """Main execution function"""
+def prune_page_cache(max_age=PAGE_CACHE_TTL):
+    """
+    Delete cached results pages older than max_age
+
+    Args:
+        max_age: Maximum page age in seconds (default: PAGE_CACHE_TTL)
+
+    Returns:
+        Number of pages deleted
+    """
+    if not os.path.isdir(PAGE_CACHE_DIR):
+        return 0
+
+    cutoff = time.time() - max_age
+    removed = 0
+    for entry in os.scandir(PAGE_CACHE_DIR):
+        if entry.is_file() and entry.stat().st_mtime <= cutoff:
+            os.remove(entry.path)
+            removed += 1
+    return removed
+
+
+def main(use_cache=False):
+    """
+    Main execution function
+
+    Args:
+        use_cache: Reuse results pages cached by earlier runs (default: False)
+    """
     # Input: PWA events CSV
     events_csv = "data/raw/pwa/pwa_events_raw.csv"
 
@@ -396,7 +722,8 @@ def main():
     divisions_csv = "data/raw/pwa/pwa_wave_divisions_raw.csv"
 
     # Initialize scraper
-    scraper = PWAResultsScraper(events_csv)
+    scraper = PWAResultsScraper(events_csv, use_cache=use_cache)
+    scraper.stream_results_to(results_csv)
 
     try:
         # Scrape all wave event results
@@ -410,6 +737,10 @@ def main():
         import traceback
         traceback.print_exc()
 
+    finally:
+        # Discard the partial temp file if the run did not reach save_results()
+        scraper.abort()
+
 
 if __name__ == "__main__":
     main()
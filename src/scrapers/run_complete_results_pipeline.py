@@ -9,7 +9,8 @@ Steps:
 4. Merge PWA + Live Heats results into unified dataset
 
 Usage:
-    python run_complete_results_pipeline.py [--skip-pwa] [--skip-matching] [--skip-liveheats]
+    python run_complete_results_pipeline.py [--skip-pwa] [--skip-matching] [--skip-liveheats] [--cache | --no-cache]
+    python run_complete_results_pipeline.py --prune-cache
 """
 
 import os
@@ -24,15 +25,20 @@ def log(message, level="INFO"):
     print(f"[{timestamp}] [{level}] {message}")
 
 
-def run_pwa_scraper():
-    """Run PWA results scraper"""
+def run_pwa_scraper(use_cache=False):
+    """
+    Run PWA results scraper
+
+    Args:
+        use_cache: Reuse PWA results pages cached by earlier runs
+    """
     log("\n" + "="*80)
     log("STEP 1: SCRAPING PWA WAVE RESULTS")
     log("="*80 + "\n")
 
     try:
         from pwa_results_scraper import main as pwa_main
-        pwa_main()
+        pwa_main(use_cache=use_cache)
         log("\n[OK] PWA scraping completed", "SUCCESS")
         return True
     except Exception as e:
@@ -116,9 +122,25 @@ def main():
         action='store_true',
         help='Skip Live Heats scraping (use existing data)'
     )
+    parser.add_argument(
+        '--cache',
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help='Reuse PWA results pages cached on disk by earlier runs (default: off)'
+    )
+    parser.add_argument(
+        '--prune-cache',
+        action='store_true',
+        help='Delete expired cached PWA results pages and exit'
+    )
 
     args = parser.parse_args()
 
+    if args.prune_cache:
+        from pwa_results_scraper import prune_page_cache
+        log(f"Pruned {prune_page_cache()} expired cached PWA results pages")
+        return
+
     print("\n")
     print("="*80)
     print("COMPLETE WAVE RESULTS PIPELINE")
@@ -138,7 +160,7 @@ def main():
         log("\n[SKIPPED] PWA scraping (using existing data)", "INFO")
         results['pwa_scraping'] = 'skipped'
     else:
-        results['pwa_scraping'] = 'success' if run_pwa_scraper() else 'failed'
+        results['pwa_scraping'] = 'success' if run_pwa_scraper(use_cache=args.cache) else 'failed'
 
     # Step 2: Event Matching
     if args.skip_matching:
@@ -6,17 +6,70 @@ from the heats/competitors structure (the public API endpoint that doesn't requi
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import pandas as pd
 from datetime import datetime
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor
 import mysql.connector
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Maximum number of LiveHeats GraphQL requests in flight at once
+MAX_CONCURRENT_REQUESTS = 8
+
+# Number of event divisions fetched per GraphQL request (as aliased fields)
+DIVISION_BATCH_SIZE = 25
+
+# Athlete fields requested for every aliased eventDivision
+DIVISION_ATHLETES_FRAGMENT = """
+    fragment DivisionAthletes on EventDivision {
+      heats {
+        competitors {
+          athlete {
+            id
+            name
+            image
+            dob
+            nationality
+          }
+        }
+      }
+    }
+"""
+
+def create_session():
+    """
+    Create a pooled requests session for the LiveHeats GraphQL API
+
+    Connections are kept alive across requests, so each query skips the TLS
+    handshake. The getAthleteInfo query only reads data, so POSTs are retried.
+
+    Returns:
+        requests.Session
+    """
+    session = requests.Session()
+
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["POST"]
+    )
+
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_connections=32, pool_maxsize=32)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+# Shared by every GraphQL request (thread-safe for concurrent posts)
+SESSION = create_session()
+
 def get_connection():
     """Create connection to Oracle MySQL Heatwave database"""
     conn = mysql.connector.connect(
@@ -32,7 +85,8 @@ def get_connection():
 def get_division_ids_from_db():
     """Get unique LiveHeats division IDs from database"""
     conn = get_connection()
-    cursor = conn.cursor()
+    # Unbuffered: rows are read off the connection as the cursor is iterated
+    cursor = conn.cursor(buffered=False)
 
     try:
         query = """
@@ -44,9 +98,10 @@ def get_division_ids_from_db():
         ORDER BY division_id
         """
 
+        # CAST normalises the stored IDs to integers (so DISTINCT and ORDER BY are
+        # numeric) and the connector already returns them as ints
         cursor.execute(query)
-        results = cursor.fetchall()
-        division_ids = [str(int(r[0])) for r in results]
+        division_ids = [str(division_id) for (division_id,) in cursor]
 
         return division_ids
 
@@ -54,18 +109,19 @@ def get_division_ids_from_db():
         cursor.close()
         conn.close()
 
-def fetch_athletes_by_division(division_id):
+def fetch_athletes_by_division(division_ids):
     """
-    Fetch athlete data from a LiveHeats event division.
+    Fetch athlete data from a batch of LiveHeats event divisions in one request.
 
-    This uses the eventDivision query which is publicly accessible
-    and returns athlete data through heats/competitors structure.
+    Each division is an aliased eventDivision field (d0, d1, ...) of a single
+    GraphQL query. eventDivision is publicly accessible and returns athlete
+    data through heats/competitors structure.
 
     Args:
-        division_id: LiveHeats division ID (string)
+        division_ids: List of LiveHeats division IDs (strings)
 
     Returns:
-        Dictionary of unique athletes keyed by athlete_id
+        Dictionary keyed by division_id, each a dictionary of unique athletes keyed by athlete_id
     """
     url = "https://liveheats.com/api/graphql"
     headers = {
@@ -73,72 +129,92 @@ def fetch_athletes_by_division(division_id):
         "User-Agent": "Mozilla/5.0"
     }
 
-    # GraphQL query to get athletes via event division
-    query = """
-    query getAthleteInfo($id: ID!) {
-      eventDivision(id: $id) {
-        heats {
-          competitors {
-            athlete {
-              id
-              name
-              image
-              dob
-              nationality
-            }
-          }
-        }
-      }
-    }
-    """
+    # GraphQL query to get athletes via event division, one alias per division
+    variables = {f"d{i}": str(division_id) for i, division_id in enumerate(division_ids)}
+    params = ", ".join(f"${alias}: ID!" for alias in variables)
+    fields = "\n".join(f"      {alias}: eventDivision(id: ${alias}) {{ ...DivisionAthletes }}" for alias in variables)
+    query = f"""
+    query getAthleteInfo({params}) {{
+{fields}
+    }}
+{DIVISION_ATHLETES_FRAGMENT}"""
 
-    variables = {"id": str(division_id)}
     payload = {"query": query, "variables": variables}
 
     try:
-        response = requests.post(url, headers=headers, json=payload, timeout=30)
+        response = SESSION.post(url, headers=headers, json=payload, timeout=30)
         response.raise_for_status()
 
         data = response.json()
 
-        # Check for GraphQL errors
+        # Check for GraphQL errors (an invalid division only nulls its own alias)
         if 'errors' in data:
-            print(f"  GraphQL error for division {division_id}: {data['errors']}")
-            return {}
+            print(f"  GraphQL error for divisions {', '.join(variables.values())}: {data['errors']}")
+
+        # A request-level error nulls the whole response, so fall back to one
+        # division per request rather than dropping every division in the batch
+        if data.get('data') is None and len(division_ids) > 1:
+            return fetch_divisions_individually(division_ids)
+
+        division_data = data.get('data') or {}
+
+        athletes_by_division = {}
+        for alias, division_id in variables.items():
+            if division_data.get(alias) is None:
+                print(f"  No division data found for ID {division_id}")
+                continue
+
+            # Extract unique athletes
+            unique_athletes = {}
+            for heat in division_data[alias]['heats']:
+                for competitor in heat['competitors']:
+                    athlete = competitor['athlete']
+
+                    # Extract year of birth from dob
+                    dob = athlete.get('dob')
+                    year_of_birth = None
+                    if dob:
+                        try:
+                            year_of_birth = int(dob.split('-')[0])
+                        except:
+                            pass
+
+                    unique_athletes[athlete['id']] = {
+                        'athlete_id': athlete['id'],
+                        'name': athlete.get('name'),
+                        'image_url': athlete.get('image'),
+                        'dob': dob,
+                        'year_of_birth': year_of_birth,
+                        'nationality': athlete.get('nationality')
+                    }
+
+            athletes_by_division[division_id] = unique_athletes
+
+        return athletes_by_division
 
-        if 'data' not in data or 'eventDivision' not in data['data'] or data['data']['eventDivision'] is None:
-            print(f"  No division data found for ID {division_id}")
+    except requests.exceptions.RequestException as e:
+        print(f"  ERROR fetching divisions {', '.join(variables.values())}: {str(e)}")
+        if len(division_ids) == 1:
             return {}
 
-        # Extract unique athletes
-        unique_athletes = {}
-        for heat in data['data']['eventDivision']['heats']:
-            for competitor in heat['competitors']:
-                athlete = competitor['athlete']
-
-                # Extract year of birth from dob
-                dob = athlete.get('dob')
-                year_of_birth = None
-                if dob:
-                    try:
-                        year_of_birth = int(dob.split('-')[0])
-                    except:
-                        pass
-
-                unique_athletes[athlete['id']] = {
-                    'athlete_id': athlete['id'],
-                    'name': athlete.get('name'),
-                    'image_url': athlete.get('image'),
-                    'dob': dob,
-                    'year_of_birth': year_of_birth,
-                    'nationality': athlete.get('nationality')
-                }
-
-        return unique_athletes
+        return fetch_divisions_individually(division_ids)
 
-    except requests.exceptions.RequestException as e:
-        print(f"  ERROR fetching division {division_id}: {str(e)}")
-        return {}
+def fetch_divisions_individually(division_ids):
+    """
+    Retry a failed batch one division per request, so a single failing
+    division doesn't drop the whole batch.
+
+    Args:
+        division_ids: List of LiveHeats division IDs (strings)
+
+    Returns:
+        Dictionary keyed by division_id, as returned by fetch_athletes_by_division
+    """
+    print("  Retrying divisions individually...")
+    athletes_by_division = {}
+    for division_id in division_ids:
+        athletes_by_division.update(fetch_athletes_by_division([division_id]))
+    return athletes_by_division
 
 def clean_liveheats_data(df):
     """
@@ -160,36 +236,25 @@ def clean_liveheats_data(df):
 
     # Merge duplicate records based on name + nationality
     # Group by name and nationality, keeping most complete record
-    def merge_records(group):
-        if len(group) == 1:
-            group = group.copy()
-            group['alt_athlete_id'] = pd.NA
-            return group.iloc[0]
-        else:
-            # Calculate completeness: count of non-null fields
-            completeness = group.notnull().sum(axis=1)
-            # Get the index of the least complete record for alt_id
-            idx_min = completeness.idxmin()
-            alt_id = group.loc[idx_min, 'athlete_id']
-
-            # Create merged record by taking first non-null value for each column
-            merged = {}
-            for col in group.columns:
-                non_nulls = group[col].dropna()
-                merged[col] = non_nulls.iloc[0] if not non_nulls.empty else None
-
-            # Add alt_athlete_id
-            merged['alt_athlete_id'] = alt_id
-
-            return pd.Series(merged)
 
     # Only group if we have duplicates
     duplicates = df.duplicated(subset=['name', 'nationality'], keep=False)
     if duplicates.any():
         print(f"  Found {duplicates.sum()} duplicate records (by name + nationality)")
-        df_grouped = df.groupby(['name', 'nationality'], as_index=False, dropna=False).apply(merge_records)
-        df_grouped.reset_index(drop=True, inplace=True)
-        df = df_grouped
+        grouped = df.groupby(['name', 'nationality'], dropna=False)
+
+        # Merged record takes the first non-null value of each column
+        merged = grouped.first()
+
+        # alt_athlete_id is the id of the least complete record (count of non-null
+        # fields, first on ties) in groups that actually had duplicates
+        completeness = df.notnull().sum(axis=1)
+        least_complete = completeness.groupby([df['name'], df['nationality']], dropna=False).idxmin()
+        alt_ids = pd.Series(df.loc[least_complete.to_numpy(), 'athlete_id'].to_numpy(), index=least_complete.index)
+        merged['alt_athlete_id'] = alt_ids.where(grouped.size() > 1)
+
+        # Restore the input column order (reset_index would move name and nationality first)
+        df = merged.reset_index()[[*df.columns, 'alt_athlete_id']]
     else:
         df['alt_athlete_id'] = pd.NA
 
@@ -213,18 +278,21 @@ def main():
     all_athletes = {}
     total_divisions = len(division_ids)
 
-    for idx, division_id in enumerate(division_ids, 1):
-        print(f"\n[{idx}/{total_divisions}] Fetching division {division_id}...")
-
-        division_athletes = fetch_athletes_by_division(division_id)
-
-        if division_athletes:
-            print(f"  Found {len(division_athletes)} athletes in this division")
-            # Merge into all_athletes (will deduplicate by athlete_id)
-            all_athletes.update(division_athletes)
-
-        # Be polite to the API
-        time.sleep(0.5)
+    # Divisions are requested in batches of aliased queries, and batches are fetched
+    # concurrently (bounded to stay polite to the API); pool.map yields them in
+    # division order so the merge below is deterministic
+    batches = [division_ids[i:i + DIVISION_BATCH_SIZE] for i in range(0, total_divisions, DIVISION_BATCH_SIZE)]
+
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as pool:
+        for idx, (batch, athletes_by_division) in enumerate(
+                zip(batches, pool.map(fetch_athletes_by_division, batches)), 1):
+            print(f"\n[{idx}/{len(batches)}] Fetched {len(batch)} divisions ({batch[0]} - {batch[-1]})")
+
+            for division_id, division_athletes in athletes_by_division.items():
+                if division_athletes:
+                    print(f"  Found {len(division_athletes)} athletes in division {division_id}")
+                    # Merge into all_athletes (will deduplicate by athlete_id)
+                    all_athletes.update(division_athletes)
 
     print(f"\nTotal unique athletes found: {len(all_athletes)}")
 
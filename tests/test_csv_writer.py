@@ -0,0 +1,25 @@
+"""Tests for src/scrapers/csv_writer.py"""
+
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'scrapers'))
+
+from csv_writer import write_dataframe_csv
+
+
+def test_write_dataframe_csv_mixed_type_column(tmp_path):
+    path = tmp_path / 'athletes.csv'
+    df = pd.DataFrame({
+        'pwa_sail_number': pd.Series(['E-12', 34, None], dtype=object),
+        'match_score': [95.5, None, 100.0],
+    })
+
+    write_dataframe_csv(df, path)
+
+    result = pd.read_csv(path, dtype={'pwa_sail_number': str})
+    assert result['pwa_sail_number'].tolist()[:2] == ['E-12', '34']
+    assert pd.isna(result['pwa_sail_number'].iloc[2])
+    assert result['match_score'].tolist()[::2] == [95.5, 100.0]